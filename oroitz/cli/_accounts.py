@@ -0,0 +1,27 @@
+# accounts command
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from oroitz.cli._common import export_results, run_workflow
+
+
+@click.command()
+@click.argument("image_path", type=click.Path(exists=True, resolve_path=True, path_type=Path))
+@click.option("--output", type=click.Path(), help="Output file for JSON export")
+@click.option("--force-reexecute", is_flag=True, default=False, help="Bypass cache and re-run")
+def accounts(image_path: Path, output: Optional[str], force_reexecute: bool) -> None:
+    """Enumerate accounts and attempt hash extraction from memory image."""
+    click.echo(f"Running account enumeration on {image_path}")
+
+    normalized = run_workflow("account_enumeration", image_path, force_reexecute)
+    if normalized is None:
+        return
+
+    if output:
+        export_results(normalized, output)
+    else:
+        click.echo(f"Users: {len(normalized.users)}")
+        click.echo(f"Hashes: {len(normalized.hashes)}")
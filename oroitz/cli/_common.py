@@ -0,0 +1,44 @@
+# Shared helpers for workflow-running CLI commands
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import click
+
+if TYPE_CHECKING:
+    from oroitz.core.output import QuickTriageOutput
+
+
+def run_workflow(
+    workflow_id: str, image_path: Path, force_reexecute: bool, display_name: Optional[str] = None
+) -> Optional["QuickTriageOutput"]:
+    """Run a registered workflow against an image and return normalized results.
+
+    display_name names the workflow in the error shown when it isn't registered.
+    """
+    from oroitz.core.executor import Executor
+    from oroitz.core.output import OutputNormalizer
+    from oroitz.core.workflow import registry, seed_workflows
+
+    seed_workflows()
+
+    workflow = registry.get(workflow_id)
+    if not workflow:
+        click.echo(f"{display_name or workflow_id} workflow not found", err=True)
+        return None
+
+    # Execute workflow (Volatility 3 auto-detects symbol tables)
+    with Executor() as executor:
+        results = executor.execute_workflow(workflow, image_path, force_reexecute=force_reexecute)
+
+    normalizer = OutputNormalizer()
+    return normalizer.normalize_quick_triage(results)
+
+
+def export_results(normalized: "QuickTriageOutput", output: str) -> None:
+    """Export normalized results as JSON."""
+    from oroitz.core.output import OutputExporter
+
+    exporter = OutputExporter()
+    exporter.export_json(normalized, Path(output))
+    click.echo(f"Results exported to {output}")
@@ -0,0 +1,15 @@
+# gui command
+
+import click
+
+
+@click.command()
+def gui() -> None:
+    """Launch the PySide6 GUI interface."""
+    try:
+        from oroitz.ui.gui.main import main
+
+        main()
+    except ImportError as e:
+        click.echo(f"GUI not available: {e}", err=True)
+        click.echo("Make sure PySide6 is installed: pip install PySide6", err=True)
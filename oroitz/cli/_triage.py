@@ -0,0 +1,31 @@
+# quick-triage command
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from oroitz.cli._common import export_results, run_workflow
+
+
+@click.command("quick-triage")
+@click.argument("image_path", type=click.Path(exists=True, resolve_path=True, path_type=Path))
+@click.option("--output", type=click.Path(), help="Output file for JSON export")
+@click.option("--force-reexecute", is_flag=True, default=False, help="Bypass cache and re-run")
+def quick_triage(image_path: Path, output: Optional[str], force_reexecute: bool) -> None:
+    """Run quick triage analysis on a memory image."""
+    click.echo(f"Running quick triage on {image_path}")
+
+    normalized = run_workflow("quick_triage", image_path, force_reexecute, "Quick triage")
+    if normalized is None:
+        return
+
+    # Export if requested
+    if output:
+        export_results(normalized, output)
+    else:
+        # Print summary
+        click.echo(f"Processes found: {len(normalized.processes)}")
+        click.echo(f"Network connections: {len(normalized.network_connections)}")
+        click.echo(f"Malfind hits: {len(normalized.malfind_hits)}")
+        click.echo(f"Users: {len(normalized.users)}")
@@ -0,0 +1,16 @@
+# tui command
+
+import click
+
+
+@click.command()
+def tui() -> None:
+    """Launch the Textual TUI interface."""
+    try:
+        from oroitz.ui.tui import OroitzTUI
+
+        app = OroitzTUI()
+        app.run()
+    except ImportError as e:
+        click.echo(f"TUI not available: {e}", err=True)
+        click.echo("Make sure Textual is installed: pip install textual", err=True)
@@ -1,79 +1,425 @@
 """Caching layer for Oroitz."""
 
+import functools
 import hashlib
+import itertools
 import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar, Union
 
-from oroitz.core.config import config
+from oroitz.core import config as _cfg
 from oroitz.core.telemetry import logger
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None  # type: ignore
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None  # type: ignore
+
+# Stdlib fallback encoders, built once: json.dumps constructs a new JSONEncoder on every
+# call that passes non-default options
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_CANONICAL_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, sort_keys=True)
+
+# File suffix for each supported on-disk format; compressed entries add ZSTD_SUFFIX
+CACHE_SUFFIXES: Dict[str, str] = {"json": ".json", "msgpack": ".mpk"}
+ZSTD_SUFFIX = ".zst"
+# Sidecar holding row counts and payload size, readable without decoding the entry
+META_SUFFIX = ".meta"
+# Suffix of the temp files entries are written to before being renamed into place
+TMP_SUFFIX = ".tmp"
+ZSTD_LEVEL = 3
+
+# Entries at least this large are decoded straight from a read-only mapping
+MMAP_THRESHOLD = 1 << 20
+
+# Lookups for keys missing from an index of the entries on disk skip the filesystem. The
+# index is rebuilt when the directory's mtime changes, checked at most this often (seconds),
+# so entries written by other processes are seen shortly after.
+PRESENCE_RECHECK_SECONDS = 1.0
+
+# clear()/get_stats() fan per-file syscalls out to a thread pool above this many entries
+PARALLEL_IO_THRESHOLD = 256
+
+_T = TypeVar("_T")
+
+try:
+    from blake3 import blake3
+
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+    blake3 = None  # type: ignore
+
+# Cache key hashing: bound once at import, components separated by NUL bytes. Both
+# algorithms produce 16-byte (32 hex character) keys.
+_HASH: Callable[[bytes], Any] = (
+    blake3 if BLAKE3_AVAILABLE else functools.partial(hashlib.blake2b, digest_size=16)
+)
+_KEY_SEP = b"\0"
+
+
+def _hexdigest(h: Any) -> str:
+    return h.hexdigest(length=16) if BLAKE3_AVAILABLE else h.hexdigest()
+
+
+def _dumps(value: Any, cache_format: str = "json") -> bytes:
+    """Serialize a cache payload in the given format."""
+    if cache_format == "msgpack":
+        return msgpack.packb(value, use_bin_type=True)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return _COMPACT_ENCODER.encode(value).encode("utf-8")
+
+
+def _canonical(value: Any) -> bytes:
+    """Serialize a value to key-sorted compact JSON for hashing."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return _CANONICAL_ENCODER.encode(value).encode("utf-8")
+
+
+def _count_rows(result: Any) -> Union[int, Dict[str, int], None]:
+    """Row count of a list result, or per-key counts of the list values of a dict result."""
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, dict):
+        return {str(k): len(v) for k, v in result.items() if isinstance(v, list)}
+    return None
+
+
+def _loads(data: Union[bytes, memoryview], cache_format: str = "json") -> Any:
+    """Deserialize a cache payload in the given format."""
+    if cache_format == "msgpack":
+        return msgpack.unpackb(data, raw=False)
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
+class _MemEntry:
+    """A serialized result held by the in-memory layer, with its use count."""
+
+    __slots__ = ("hits", "used", "payload")
+
+    def __init__(self, hits: int, used: int, payload: bytes) -> None:
+        self.hits = hits
+        self.used = used
+        self.payload = payload
+
 
 class Cache:
     """Filesystem-based cache for plugin results."""
 
-    def __init__(self, cache_dir: Optional[Path] = None):
-        self.cache_dir = cache_dir or config.cache_dir
+    def __init__(self, cache_dir: Optional[Path] = None, cache_format: Optional[str] = None):
+        self.cache_dir = cache_dir or _cfg.config.cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_format = self._resolve_format(cache_format or _cfg.config.cache_format)
+        self.compress = _cfg.config.cache_compression and ZSTD_AVAILABLE
+        # Frequently used results kept in front of the disk cache, bounded by entry count
+        # and by their serialized size: cache key -> _MemEntry. Entries hold the encoded
+        # payload, so every hit decodes objects of its own that callers may modify.
+        self.memory_entries = _cfg.config.cache_memory_entries
+        self.memory_bytes = _cfg.config.cache_memory_bytes
+        self._mem: Dict[str, _MemEntry] = {}
+        self._mem_size = 0
+        # Use count of the last evicted entry; new entries start just above it
+        self._mem_age = 0
+        self._mem_clock = itertools.count()
+        self._mem_lock = threading.Lock()
+        # Keys of the entries on disk, listed on first lookup
+        self._present: Optional[Set[str]] = None
+        self._present_mtime_ns = 0
+        self._present_checked = 0.0
+        self._present_lock = threading.Lock()
+
+    @staticmethod
+    def _resolve_format(cache_format: str) -> str:
+        """Validate the configured format, falling back to JSON when unavailable."""
+        if cache_format not in CACHE_SUFFIXES:
+            raise ValueError(f"Unsupported cache format: {cache_format}")
+        if cache_format == "msgpack" and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack is not installed, using JSON cache format")
+            return "json"
+        return cache_format
 
     def _get_cache_key(self, session_id: str, plugin_name: str, parameters: Dict[str, Any]) -> str:
-        """Generate cache key from session, plugin, and parameters."""
-        key_data: Dict[str, Any] = {
-            "session_id": session_id,
-            "plugin_name": plugin_name,
-            "parameters": parameters,
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
-        return hashlib.sha256(key_str.encode()).hexdigest()
+        """Generate cache key from session, plugin, parameters and on-disk format."""
+        # Feed each component straight into the hash instead of building one JSON document
+        h = _HASH(session_id.encode())
+        h.update(_KEY_SEP)
+        h.update(plugin_name.encode())
+        h.update(_KEY_SEP)
+        h.update(self.cache_format.encode())
+        h.update(_KEY_SEP)
+        h.update(_canonical(parameters))
+        return _hexdigest(h)
+
+    def _cache_file(self, cache_key: str) -> Path:
+        suffix = CACHE_SUFFIXES[self.cache_format] + (ZSTD_SUFFIX if self.compress else "")
+        return self.cache_dir / f"{cache_key}{suffix}"
+
+    def _meta_file(self, cache_key: str) -> Path:
+        return self.cache_dir / f"{cache_key}{META_SUFFIX}"
+
+    def _cache_entries(
+        self, include_meta: bool = False, include_tmp: bool = False
+    ) -> List[os.DirEntry]:
+        """List cache entries of every supported format in a single directory scan."""
+        suffixes = tuple(CACHE_SUFFIXES.values()) + tuple(
+            suffix + ZSTD_SUFFIX for suffix in CACHE_SUFFIXES.values()
+        )
+        if include_meta:
+            suffixes += (META_SUFFIX,)
+        if include_tmp:
+            suffixes += (TMP_SUFFIX,)
+        with os.scandir(self.cache_dir) as it:
+            return [entry for entry in it if entry.name.endswith(suffixes) and entry.is_file()]
+
+    def _remember(self, cache_key: str, payload: Union[bytes, memoryview]) -> None:
+        """Keep a serialized result in memory, evicting the least frequently used entries.
 
-    def get(self, session_id: str, plugin_name: str, parameters: Dict[str, Any]) -> Optional[Any]:
+        Ties go to the least recently used entry, and the entry being stored is never the
+        one evicted. Use counts age: a new entry starts one above the count of the last
+        entry evicted, so once old entries stop being used, new ones can displace them.
+        """
+        if self.memory_entries <= 0 or len(payload) > self.memory_bytes:
+            return
+        payload = bytes(payload)
+        with self._mem_lock:
+            old = self._mem.pop(cache_key, None)
+            if old is not None:
+                self._mem_size -= len(old.payload)
+            hits = old.hits if old is not None else self._mem_age + 1
+            while self._mem and (
+                len(self._mem) >= self.memory_entries
+                or self._mem_size + len(payload) > self.memory_bytes
+            ):
+                victim = min(self._mem, key=lambda k: (self._mem[k].hits, self._mem[k].used))
+                evicted = self._mem.pop(victim)
+                self._mem_size -= len(evicted.payload)
+                self._mem_age = evicted.hits
+            self._mem[cache_key] = _MemEntry(hits, next(self._mem_clock), payload)
+            self._mem_size += len(payload)
+
+    def _is_present(self, cache_key: str) -> bool:
+        """Whether an entry may exist on disk, answered from the presence index."""
+        with self._present_lock:
+            now = time.monotonic()
+            if self._present is None or now - self._present_checked >= PRESENCE_RECHECK_SECONDS:
+                self._present_checked = now
+                try:
+                    mtime_ns = os.stat(self.cache_dir).st_mtime_ns
+                except OSError:
+                    return True
+                if self._present is None or mtime_ns != self._present_mtime_ns:
+                    # Stat before listing: a write racing the scan still changes the mtime
+                    self._present = {entry.name.split(".", 1)[0] for entry in self._cache_entries()}
+                    # A directory modified within the last two seconds may change again
+                    # without its (possibly coarse) mtime moving; list it again next time
+                    racy = time.time_ns() - mtime_ns < 2_000_000_000
+                    self._present_mtime_ns = -1 if racy else mtime_ns
+            return cache_key in self._present
+
+    def _mark_present(self, cache_key: str, present: bool) -> None:
+        with self._present_lock:
+            if self._present is not None:
+                if present:
+                    self._present.add(cache_key)
+                else:
+                    self._present.discard(cache_key)
+
+    def _decode(self, cache_key: str, data: Union[bytes, memoryview]) -> Any:
+        """Decode an entry, keeping its serialized (uncompressed) form in memory."""
+        if self.compress:
+            data = zstandard.ZstdDecompressor().decompress(data)
+        result = _loads(data, self.cache_format)
+        self._remember(cache_key, data)
+        return result
+
+    def _read_entry(self, cache_key: str, cache_file: Path) -> Any:
+        """Decode a cache file, mapping large files instead of copying them into memory."""
+        with open(cache_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                return self._decode(cache_key, f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return self._decode(cache_key, view)
+
+    def _write_atomic(self, path: Path, payload: bytes) -> None:
+        """Write to a unique temp file and rename it over the target.
+
+        Readers never see a partial file. No fsync: the cache can always be rebuilt.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=TMP_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _map_entries(
+        self, func: Callable[[os.DirEntry], _T], entries: List[os.DirEntry]
+    ) -> List[_T]:
+        """Apply an I/O-bound function to entries, in parallel for large caches."""
+        if len(entries) < PARALLEL_IO_THRESHOLD:
+            return [func(entry) for entry in entries]
+        with ThreadPoolExecutor(max_workers=max(1, _cfg.config.max_concurrency)) as pool:
+            return list(pool.map(func, entries))
+
+    def make_key(self, session_id: str, plugin_name: str, parameters: Dict[str, Any]) -> str:
+        """Compute an entry's key once, for callers that look it up and then store it."""
+        return self._get_cache_key(session_id, plugin_name, parameters)
+
+    def contains(
+        self,
+        session_id: str,
+        plugin_name: str,
+        parameters: Dict[str, Any],
+        cache_key: Optional[str] = None,
+    ) -> bool:
+        """Whether a result is cached, without reading it."""
+        cache_key = cache_key or self._get_cache_key(session_id, plugin_name, parameters)
+        with self._mem_lock:
+            if cache_key in self._mem:
+                return True
+        return self._is_present(cache_key) and self._cache_file(cache_key).exists()
+
+    def get(
+        self,
+        session_id: str,
+        plugin_name: str,
+        parameters: Dict[str, Any],
+        cache_key: Optional[str] = None,
+    ) -> Optional[Any]:
         """Get cached result if exists."""
-        cache_key = self._get_cache_key(session_id, plugin_name, parameters)
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        cache_key = cache_key or self._get_cache_key(session_id, plugin_name, parameters)
+
+        with self._mem_lock:
+            entry = self._mem.get(cache_key)
+            if entry is not None:
+                entry.hits += 1
+                entry.used = next(self._mem_clock)
+        if entry is not None:
+            logger.debug("Memory cache hit for %s", plugin_name)
+            return _loads(entry.payload, self.cache_format)
+
+        if not self._is_present(cache_key):
+            logger.debug("Cache miss for %s", plugin_name)
+            return None
 
+        cache_file = self._cache_file(cache_key)
         if cache_file.exists():
             try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    result: Any = json.load(f)
-                logger.debug(f"Cache hit for {plugin_name}")
+                result = self._read_entry(cache_key, cache_file)
+                logger.debug("Cache hit for %s", plugin_name)
                 return result
             except Exception as e:
-                logger.warning(f"Failed to load cache for {plugin_name}: {e}")
+                logger.warning("Failed to load cache for %s: %s", plugin_name, e)
                 # Remove corrupted cache file
                 cache_file.unlink(missing_ok=True)
+                self._meta_file(cache_key).unlink(missing_ok=True)
+                self._mark_present(cache_key, False)
 
-        logger.debug(f"Cache miss for {plugin_name}")
+        logger.debug("Cache miss for %s", plugin_name)
         return None
 
     def set(
-        self, session_id: str, plugin_name: str, parameters: Dict[str, Any], result: Any
+        self,
+        session_id: str,
+        plugin_name: str,
+        parameters: Dict[str, Any],
+        result: Any,
+        cache_key: Optional[str] = None,
     ) -> None:
         """Cache a result."""
-        cache_key = self._get_cache_key(session_id, plugin_name, parameters)
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        cache_key = cache_key or self._get_cache_key(session_id, plugin_name, parameters)
+        cache_file = self._cache_file(cache_key)
 
         try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2)
-            logger.debug(f"Cached result for {plugin_name}")
+            encoded = _dumps(result, self.cache_format)
+            meta = {"len": _count_rows(result), "size": len(encoded)}
+            payload = encoded
+            if self.compress:
+                payload = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(encoded)
+            self._write_atomic(cache_file, payload)
+            self._write_atomic(self._meta_file(cache_key), _dumps(meta))
+            self._mark_present(cache_key, True)
+            self._remember(cache_key, encoded)
+            logger.debug("Cached result for %s", plugin_name)
         except Exception as e:
-            logger.warning(f"Failed to cache result for {plugin_name}: {e}")
+            logger.warning("Failed to cache result for %s: %s", plugin_name, e)
+
+    def stats_for(
+        self, session_id: str, plugin_name: str, parameters: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Return row counts and serialized size of an entry without decoding it."""
+        cache_key = self._get_cache_key(session_id, plugin_name, parameters)
+        try:
+            with open(self._meta_file(cache_key), "rb") as f:
+                meta: Dict[str, Any] = _loads(f.read())
+            return meta
+        except (OSError, ValueError):
+            return None
 
     def clear(self) -> None:
-        """Clear all cached results."""
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
+        """Clear all cached results, and temp files left behind by interrupted writes."""
+        with self._mem_lock:
+            self._mem.clear()
+            self._mem_size = 0
+            self._mem_age = 0
+        with self._present_lock:
+            self._present = None
+        # Entries another process removes first are already gone, which is fine
+        self._map_entries(
+            lambda entry: Path(entry.path).unlink(missing_ok=True),
+            self._cache_entries(include_meta=True, include_tmp=True),
+        )
         logger.info("Cache cleared")
 
     def get_stats(self) -> Dict[str, Union[int, float]]:
         """Get cache statistics."""
-        cache_files = list(self.cache_dir.glob("*.json"))
-        total_size = sum(f.stat().st_size for f in cache_files) if cache_files else 0
+        entries = self._cache_entries()
+        total_size = sum(self._map_entries(lambda entry: entry.stat().st_size, entries))
         return {
-            "total_entries": len(cache_files),
+            "total_entries": len(entries),
             "cache_size_mb": total_size / (1024 * 1024),
         }
 
 
-# Global cache instance
-cache = Cache()
+@functools.lru_cache(maxsize=1)
+def get_cache() -> Cache:
+    """Return the shared cache, creating its directory on first use."""
+    return Cache()
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from oroitz.core.cache import cache` working without creating the cache at import
+    if name == "cache":
+        return get_cache()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
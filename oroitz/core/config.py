@@ -1,8 +1,13 @@
 """Configuration management for Oroitz core engine."""
 
+import functools
+import os
+import threading
+import tomllib
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,22 +16,30 @@ class Config(BaseSettings):
 
     # Core paths
     config_file: Optional[Path] = None
-    cache_dir: Path = Path.home() / ".oroitz" / "cache"
-    sessions_dir: Path = Path.home() / ".oroitz" / "sessions"
+    cache_dir: Path = Field(default_factory=lambda: Path.home() / ".oroitz" / "cache")
+    sessions_dir: Path = Field(default_factory=lambda: Path.home() / ".oroitz" / "sessions")
     log_level: str = "INFO"
     max_concurrency: int = 4
+    executor_kind: Literal["thread", "process"] = "thread"  # worker pool for workflows
 
     # Volatility settings
     volatility_path: Optional[Path] = None
     symbols_path: Optional[Path] = None
     plugin_dirs: List[Path] = []
+    # Opt in to re-running a plugin through the vol CLI when the in-process Python API fails
+    volatility_cli_fallback: bool = False
     # Execution retry settings (Phase 6 hardening)
     volatility_retry_attempts: int = 2
     volatility_retry_backoff_seconds: float = 1.0
+    volatility_retry_total_seconds: float = 30.0  # cap on total backoff per plugin
 
     # GUI settings
     telemetry_enabled: bool = False
     cache_enabled: bool = True
+    cache_format: str = "json"  # "json" or "msgpack"
+    cache_compression: bool = True  # zstd-compress entries when zstandard is installed
+    cache_memory_entries: int = 64  # results kept in memory in front of the disk cache
+    cache_memory_bytes: int = 256 * 1024 * 1024  # serialized size budget of those results
     force_reexecute_on_fail: bool = False
     auto_export: bool = False
     theme: str = "system"
@@ -42,16 +55,8 @@ class Config(BaseSettings):
     def from_file(cls, file_path: Path) -> "Config":
         """Load configuration from a TOML file."""
         try:
-            import tomllib  # Python 3.11+
-        except ModuleNotFoundError:  # pragma: no cover - fallback for older runtimes
-            tomllib = None  # type: ignore
-
-        data = {}
-        try:
-            if tomllib is not None:
-                with open(file_path, "rb") as f:
-                    data = tomllib.load(f)
-            # If no tomllib, return with config_file only
+            st = os.stat(file_path)
+            data = _load_toml(str(file_path), st.st_mtime_ns, st.st_size)
         except Exception:
             # On any error, fall back to empty data but record config_file
             data = {}
@@ -65,5 +70,24 @@ class Config(BaseSettings):
         return cls(config_file=file_path)
 
 
-# Global config instance
-config = Config()
+@functools.lru_cache(maxsize=16)
+def _load_toml(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a TOML file; mtime and size are part of the key so edits invalidate it."""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+# Global config instance, created on first access (PEP 562) so importing this module does
+# not parse .env or the environment
+_config_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "config":
+        with _config_lock:
+            instance = globals().get("config")
+            if instance is None:
+                instance = Config()
+                globals()["config"] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,25 @@
 """Volatility 3 execution wrapper for Oroitz."""
 
+import concurrent.futures
+import functools
 import json
+import mmap
+import multiprocessing
+import os
+import shutil
 import subprocess
+import sys
+import tempfile
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
-from oroitz.core.cache import cache
-from oroitz.core.config import config
-from oroitz.core.telemetry import log_event, logger
+from oroitz.core import config as _cfg
+from oroitz.core.cache import get_cache
+from oroitz.core.telemetry import events_enabled, log_event, logger
 
 # Volatility 3 imports with proper type checking
 if TYPE_CHECKING:
@@ -25,6 +35,12 @@ try:
     import volatility3.framework.contexts as contexts
     import volatility3.framework.plugins as plugins
     from volatility3.cli import CommandLine
+    from volatility3.cli.text_renderer import JsonRenderer
+    from volatility3.framework.configuration import requirements
+    from volatility3.framework.constants import AUTOMAGIC_CONFIG_PATH
+    from volatility3.framework.interfaces.automagic import AutomagicInterface
+    from volatility3.framework.interfaces.configuration import path_join
+    from volatility3.framework.interfaces.renderers import BaseAbsentValue
 
     VOLATILITY_AVAILABLE = True
 except ImportError:
@@ -33,6 +49,491 @@ except ImportError:
     contexts = None  # type: ignore
     plugins = None  # type: ignore
     CommandLine = None  # type: ignore
+    JsonRenderer = None  # type: ignore
+    requirements = None  # type: ignore
+    AUTOMAGIC_CONFIG_PATH = None  # type: ignore
+    AutomagicInterface = None  # type: ignore
+    path_join = None  # type: ignore
+    BaseAbsentValue = None  # type: ignore
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None  # type: ignore
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
+# Read size for the vol stdout pipe
+PIPE_BUFFER_SIZE = 1 << 20
+
+_JSON_ERRORS: Tuple[type, ...] = (ValueError,) + ((ijson.JSONError,) if IJSON_AVAILABLE else ())
+
+
+def _parse_json(data: Union[bytes, bytearray, memoryview]) -> Any:
+    """Parse a complete JSON document from raw bytes."""
+    # Skips a separate utf-8 decode of the whole output; json.loads needs real bytes
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data if isinstance(data, (bytes, bytearray)) else bytes(data))
+
+
+class _PipeReader:
+    """File-like view of a pipe whose read() returns as soon as any data is available.
+
+    BufferedReader.read(n) blocks until n bytes arrive, which would hold back rows that
+    ijson could already parse.
+    """
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read1(size)  # type: ignore[attr-defined]
+
+
+def _load_json_stream(stream: IO[bytes]) -> Any:
+    """Parse JSON from a pipe, decoding a top-level array row by row when ijson is available."""
+    if IJSON_AVAILABLE and stream.peek(1)[:1] == b"[":  # type: ignore[attr-defined]
+        return list(ijson.items(_PipeReader(stream), "item", use_float=True))
+    return _parse_json(_read_pipe(stream))
+
+
+def _iter_json_rows(stream: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    """Yield the rows of vol's JSON output from a pipe as soon as each one is parsed."""
+    if IJSON_AVAILABLE and stream.peek(1)[:1] == b"[":  # type: ignore[attr-defined]
+        yield from ijson.items(_PipeReader(stream), "item", use_float=True)
+        return
+    # Without ijson (or for a wrapped document) rows are only known once all of it is parsed
+    data = _parse_json(_read_pipe(stream))
+    if isinstance(data, dict):
+        data = next((value for value in data.values() if _is_row_list(value)), [])
+    if not isinstance(data, list):
+        raise ValueError("Unexpected output format")
+    yield from data
+
+
+def _load_json_file(f: IO[bytes]) -> Any:
+    """Parse a spooled JSON document straight from a read-only mapping of the file."""
+    if os.fstat(f.fileno()).st_size == 0:
+        # mmap refuses empty files; let the parser report the missing document
+        return _parse_json(b"")
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        return _parse_json(view)
+
+
+def _read_pipe(stream: IO[bytes]) -> bytearray:
+    """Read a pipe to EOF into one growing buffer.
+
+    read() would collect every chunk and then join them, briefly holding the output twice.
+    """
+    buf = bytearray()
+    while chunk := stream.read1(PIPE_BUFFER_SIZE):  # type: ignore[attr-defined]
+        buf += chunk
+    return buf
+
+
+# Deterministic fallback rows (ADR-0004), built once. Callers get a fresh list of the
+# shared row dicts and only read them.
+_PSLIST_MOCK: Tuple[Dict[str, Any], ...] = (
+    {
+        "PID": 4,
+        "PPID": 0,
+        "ImageFileName": "System",
+        "Offset(V)": "0x12345678",
+        "Threads": 8,
+        "Handles": 100,
+        "SessionId": 0,
+        "Wow64": False,
+        "CreateTime": "2023-01-01T00:00:00.000000+00:00",
+        "ExitTime": None,
+    },
+    {
+        "PID": 1234,
+        "PPID": 4,
+        "ImageFileName": "smss.exe",
+        "Offset(V)": "0x87654321",
+        "Threads": 2,
+        "Handles": 50,
+        "SessionId": 0,
+        "Wow64": False,
+        "CreateTime": "2023-01-01T00:00:01.000000+00:00",
+        "ExitTime": None,
+    },
+)
+
+_NETSCAN_MOCK: Tuple[Dict[str, Any], ...] = (
+    {
+        "Offset(V)": "0xabcdef12",
+        "PID": 1234,
+        "Size": 123,
+        "Proto": "TCPv4",
+        "LocalAddr": "192.168.1.100",
+        "LocalPort": 443,
+        "ForeignAddr": "10.0.0.1",
+        "ForeignPort": 80,
+        "State": "ESTABLISHED",
+        "Created": "2020-12-31T16:30:00.000000+00:00",  # String instead of int
+        "Owner": "chrome.exe",
+    },
+)
+
+_MALFIND_MOCK: Tuple[Dict[str, Any], ...] = (
+    {
+        "PID": 5678,
+        "Process": "suspicious.exe",
+        "Start VPN": "0x400000",
+        "End VPN": "0x500000",
+        "Tag": "VadS",
+        "Protection": "PAGE_EXECUTE_READWRITE",
+        "CommitCharge": 1,
+        "PrivateMemory": 4096,
+        "FileOffset": 0,
+        "FileName": None,
+    },
+)
+
+_HASHDUMP_MOCK: Tuple[Dict[str, Any], ...] = (
+    {
+        "Username": "Administrator",
+        "UID": 500,
+        "GID": 500,
+        "Hash": "aad3b435b51404eeaad3b435b51404ee:31d6cfe0d16ae931b73c59d7e0c089c0",
+        "Type": "NTLM",
+    },
+    {
+        "Username": "user1",
+        "UID": 1000,
+        "GID": 1000,
+        "Hash": "e19ccf75ee54e06b06a5907af13cef42:31d6cfe0d16ae931b73c59d7e0c089c0",
+        "Type": "NTLM",
+    },
+)
+
+_ACCOUNTS_MOCK: Tuple[Dict[str, Any], ...] = (
+    {
+        "Username": "Administrator",
+        "UID": 500,
+        "GID": 500,
+        "HomeDir": "/home/admin",
+        "Shell": "/bin/bash",
+        "Description": "Administrator account",
+    },
+    {
+        "Username": "user1",
+        "UID": 1000,
+        "GID": 1000,
+        "HomeDir": "/home/user1",
+        "Shell": "/bin/bash",
+        "Description": "Regular user",
+    },
+)
+
+_GETSIDS_MOCK: Tuple[Dict[str, Any], ...] = (
+    {
+        "Name": "Administrator",
+        "SID": "S-1-5-21-1367486129-1636748403-2738611465-500",
+        "PID": 2496,
+        "Process": "explorer.exe",
+    },
+    {
+        "Name": "Domain Users",
+        "SID": "S-1-5-21-1367486129-1636748403-2738611465-513",
+        "PID": 2496,
+        "Process": "explorer.exe",
+    },
+    {
+        "Name": "Administrators",
+        "SID": "S-1-5-32-544",
+        "PID": 2496,
+        "Process": "explorer.exe",
+    },
+)
+
+# Matched in order against substrings of the plugin name
+_MOCK_DATA: Tuple[Tuple[str, Tuple[Dict[str, Any], ...]], ...] = (
+    ("pslist", _PSLIST_MOCK),
+    ("netscan", _NETSCAN_MOCK),
+    ("malfind", _MALFIND_MOCK),
+    ("hashdump", _HASHDUMP_MOCK),
+    ("lsadump", _ACCOUNTS_MOCK),
+    ("cachedump", _ACCOUNTS_MOCK),
+    ("getsids", _GETSIDS_MOCK),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _mock_rows(plugin_name: str) -> Tuple[Dict[str, Any], ...]:
+    """Resolve a plugin name to its mock rows, once per distinct name."""
+    for fragment, rows in _MOCK_DATA:
+        if fragment in plugin_name:
+            return rows
+    # Generic mock data for unknown plugins - no rows
+    return ()
+
+
+def _is_row_list(value: Any) -> bool:
+    # JSON parsers only produce exact list/dict instances, so skip isinstance's subclass walk
+    return type(value) is list and bool(value) and type(value[0]) is dict
+
+
+# Worker pools execute_workflow can dispatch plugins to: threads suit the vol subprocess
+# path, processes keep in-process Volatility runs and output parsing off a shared GIL
+EXECUTOR_KINDS = ("thread", "process")
+
+
+def _resolve_poetry_vol() -> Optional[Tuple[str, ...]]:
+    """Return the absolute path of the vol script inside the poetry environment."""
+    try:
+        result = subprocess.run(
+            ["poetry", "run", "python", "-c", "import shutil; print(shutil.which('vol') or '')"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    vol_path = result.stdout.strip()
+    return (vol_path,) if result.returncode == 0 and vol_path else None
+
+
+# Runs the vol console script's entry point without going through the script itself
+_VOL_MAIN = "import sys; sys.argv[0] = 'vol'; from volatility3.cli import main; sys.exit(main())"
+
+
+def _find_vol_command() -> Optional[Tuple[str, ...]]:
+    """Find a volatility3 CLI command without starting any process."""
+    # volatility3 is importable here: start its CLI with this interpreter, skipping PATH
+    # shims and console-script wrappers. A frozen build's executable is oroitz itself,
+    # which cannot run -c, so it needs a real vol script
+    if VOLATILITY_AVAILABLE and not getattr(sys, "frozen", False):
+        return (sys.executable, "-c", _VOL_MAIN)
+    # A vol script on PATH (e.g. inside an activated environment) needs no probe process
+    vol_path = shutil.which("vol")
+    return (vol_path,) if vol_path else None
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_vol_command() -> Optional[Tuple[str, ...]]:
+    """Find a volatility3 CLI command, or None if there is none."""
+    vol_command = _find_vol_command()
+    if vol_command is not None:
+        return vol_command
+    if not shutil.which("poetry"):
+        return None
+    try:
+        # Only the exit code matters for this probe
+        result = subprocess.run(
+            ["poetry", "run", "vol"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=10,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    if result.returncode == 2:  # 2 means help/usage shown, which means vol is available
+        # Resolve the script poetry would run so each plugin is a single exec
+        # instead of poetry -> python -> vol
+        return _resolve_poetry_vol() or ("poetry", "run", "vol")
+    return None
+
+
+# Plugin name prefixes that tie a plugin to one OS
+OS_FAMILIES = frozenset(("windows", "linux", "mac"))
+
+
+def _spec_key(plugin: Any) -> Tuple[str, str]:
+    """Identify a workflow plugin spec by its name and canonical parameters."""
+    return plugin.name, json.dumps(plugin.parameters, sort_keys=True, default=str)
+
+
+# Cache session holding OS detections, one entry per image fingerprint
+OS_DETECT_SESSION = "_os_detect"
+
+
+def _image_fingerprint(image_path: str) -> Optional[Dict[str, Any]]:
+    """Identify an image by absolute path, size and mtime; None if it cannot be stat'ed."""
+    try:
+        st = os.stat(image_path)
+    except OSError:
+        return None
+    return {
+        "image_path": os.path.abspath(image_path),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+    }
+
+
+_plugin_list: Optional[Dict[str, Any]] = None
+# Lowercased registered names and module paths ("windows.pslist") -> registered name
+_plugin_index: Dict[str, str] = {}
+_plugin_list_lock = threading.Lock()
+
+
+def _treegrid_rows(treegrid: Any) -> List[Dict[str, Any]]:
+    """Convert a plugin's TreeGrid into the rows `vol -r json` prints.
+
+    Rows are built while the plugin's generator runs (or in one visit of an already populated
+    grid). Values go through the JSON renderer's type renderers, absent values become None,
+    and child rows nest under "__children" as in the CLI output.
+    """
+    type_renderers = JsonRenderer._type_renderers  # type: ignore[union-attr]
+    columns = [
+        (column.name, type_renderers.get(column.type, type_renderers["default"]))
+        for column in treegrid.columns
+    ]
+    rows: List[Dict[str, Any]] = []
+    rows_by_path: Dict[str, Dict[str, Any]] = {}
+
+    def visitor(node: Any, accumulator: None) -> None:
+        row: Dict[str, Any] = {"__children": []}
+        for (name, render), value in zip(columns, node.values):
+            data = render(value)
+            row[name] = None if isinstance(data, BaseAbsentValue) else data  # type: ignore
+        parent = node.parent
+        if parent is not None and parent.path in rows_by_path:
+            rows_by_path[parent.path]["__children"].append(row)
+        else:
+            rows.append(row)
+        rows_by_path[node.path] = row
+        return accumulator
+
+    if treegrid.populated:
+        treegrid.visit(None, visitor, None)
+    else:
+        treegrid.populate(visitor, None)
+    return rows
+
+
+def _index_plugins(plugin_list: Dict[str, Any]) -> Dict[str, str]:
+    """Index registered names by lowercased full name, then by lowercased module path."""
+    index: Dict[str, str] = {}
+    for name in plugin_list:
+        index.setdefault(name.lower(), name)
+    for name in plugin_list:
+        index.setdefault(name.rsplit(".", 1)[0].lower(), name)
+    return index
+
+
+def _get_plugin_list() -> Dict[str, Any]:
+    """Import Volatility plugin modules once per process and return the plugin map."""
+    global _plugin_list
+    if _plugin_list is None:
+        # Pool threads starting together must not each walk the plugin tree
+        with _plugin_list_lock:
+            if _plugin_list is None:
+                # Mirror CLI behavior: import every plugin file, then list what registered
+                failures = framework.import_files(volatility3.plugins, True)  # type: ignore
+                if failures:
+                    logger.debug("Volatility plugin import failures: %s", failures)
+                plugin_list = framework.list_plugins()  # type: ignore
+                _plugin_index.update(_index_plugins(plugin_list))
+                _plugin_list = plugin_list
+    return _plugin_list
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_plugin_name(plugin_name: str) -> Optional[str]:
+    """Map a requested plugin name to its registered name, or None if nothing matches."""
+    plugin_list = _get_plugin_list()
+    if plugin_name in plugin_list:
+        return plugin_name
+    # Full name in any case, or a module path (e.g., 'windows.pslist' -> 'windows.pslist.PsList')
+    indexed = _plugin_index.get(plugin_name.lower())
+    if indexed is not None:
+        return indexed
+    # Fall back to any partial name match
+    matching_plugins = [name for name in plugin_list.keys() if plugin_name in name.lower()]
+    # Take the first match (should be the most relevant)
+    return matching_plugins[0] if matching_plugins else None
+
+
+@functools.lru_cache(maxsize=None)
+def _automagic_classes(plugin_class: Any) -> Tuple[Any, ...]:
+    """The automagic classes chosen for a plugin class, in priority order, once per class."""
+    # Mirrors automagic.available(), minus instantiating every automagic: the choice only
+    # looks at class attributes, so it holds for every context
+    framework.import_files(automagic)  # type: ignore
+    subclasses = framework.class_subclasses(AutomagicInterface)  # type: ignore
+    classes = sorted(subclasses, key=lambda clazz: clazz.priority)
+    return tuple(automagic.choose_automagic(classes, plugin_class))  # type: ignore
+
+
+def _choose_automagics(ctx: Any, plugin_class: Any) -> List[Any]:
+    """Instantiate the automagics chosen for a plugin class against a context."""
+    return [
+        clazz(ctx, path_join(AUTOMAGIC_CONFIG_PATH, clazz.__name__))
+        for clazz in _automagic_classes(plugin_class)
+    ]
+
+
+def _requirement_signature(requirement: Any) -> Tuple[Any, ...]:
+    """Name, type and constraints (architectures, OSes) of a requirement and its children."""
+    requirement_type = type(requirement)
+    return (
+        requirement.name,
+        f"{requirement_type.__module__}.{requirement_type.__qualname__}",
+        tuple(sorted(getattr(requirement, "architectures", None) or ())),
+        tuple(sorted(str(os_name) for os_name in getattr(requirement, "oses", None) or ())),
+        tuple(sorted(_requirement_signature(sub) for sub in requirement.requirements.values())),
+    )
+
+
+class _ImageContext:
+    """Configuration automagic stacked for the plugins run against one image.
+
+    Each plugin runs in a Volatility context of its own. The configuration of the layers and
+    symbol tables stacked for one plugin is spliced under each later plugin's requirements
+    with the same signature, so construction rebuilds them from it instead of scanning the
+    image again.
+    """
+
+    def __init__(self, image_path: str, fingerprint: Optional[Dict[str, Any]]) -> None:
+        self.image_path = image_path
+        self.fingerprint = fingerprint
+        # (OS family, requirement signature) -> stacked configuration
+        self.stacked: Dict[Tuple[str, Tuple[Any, ...]], Any] = {}
+        # Held while plugins are constructed, so a plugin waits for the stacking of the one
+        # before it rather than scanning the image too
+        self.lock = threading.Lock()
+
+    def new_context(self) -> Any:
+        """A fresh Volatility context for one plugin run against the image."""
+        ctx = contexts.Context()  # type: ignore
+        ctx.config["automagic.LayerStacker.single_location"] = f"file://{self.image_path}"
+        return ctx
+
+    @staticmethod
+    def _stackable(plugin_class: Any) -> Iterator[Any]:
+        for requirement in plugin_class.get_requirements():
+            if isinstance(
+                requirement,
+                (requirements.ModuleRequirement, requirements.TranslationLayerRequirement),  # type: ignore
+            ):
+                yield requirement
+
+    def reuse_stacked(self, ctx: Any, family: str, plugin_class: Any, config_path: str) -> None:
+        """Splice configuration stacked for earlier plugins under this plugin's path."""
+        for requirement in self._stackable(plugin_class):
+            stacked = self.stacked.get((family, _requirement_signature(requirement)))
+            if stacked is not None:
+                ctx.config.splice(f"{config_path}.{requirement.name}", stacked.clone())
+
+    def remember_stacked(self, ctx: Any, family: str, plugin_class: Any, config_path: str) -> None:
+        """Record the configuration automagic stacked for a constructed plugin."""
+        for requirement in self._stackable(plugin_class):
+            key = (family, _requirement_signature(requirement))
+            if key not in self.stacked and not requirement.unsatisfied(ctx, config_path):
+                path = f"{config_path}.{requirement.name}"
+                self.stacked[key] = ctx.config.branch(path).clone()
 
 
 class ExecutionResult(BaseModel):
@@ -52,80 +553,119 @@ class Executor:
     """Handles execution of Volatility plugins."""
 
     def __init__(self) -> None:
-        self.max_concurrency = config.max_concurrency
-        # Check if volatility3 CLI is available
-        self._volatility_available = self._check_volatility_cli()
-
-    def _check_volatility_cli(self) -> bool:
-        """Check if volatility3 CLI is available."""
-        try:
-            # Try using poetry run vol first
-            result = subprocess.run(
-                ["poetry", "run", "vol"], capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 2:  # 2 means help/usage shown, which means vol is available
-                self._vol_command = ["poetry", "run", "vol"]
-                return True
-
-            # Fallback to just vol
-            result = subprocess.run(["vol"], capture_output=True, text=True, timeout=10)
-            if result.returncode == 2:
-                self._vol_command = ["vol"]
-                return True
-
-            return False
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        self.max_concurrency = _cfg.config.max_concurrency
+        self.executor_kind = self._resolve_executor_kind(_cfg.config.executor_kind)
+        # Set by shutdown() to cut retry backoff short
+        self._stop = threading.Event()
+        # Top-level key holding the rows when a plugin's JSON output is an object
+        self._data_keys: Dict[str, str] = {}
+        # Check if volatility3 CLI is available (probed once per process)
+        # Only cheap lookups here; probing through poetry (a subprocess) waits for
+        # _ensure_cli on the first CLI use. None means not probed yet.
+        vol_command = _find_vol_command()
+        self._volatility_available: Optional[bool] = True if vol_command else None
+        self._vol_command: List[str] = list(vol_command or ())
+        # Stacked Python API configuration by image path, rebuilt when the image's size or
+        # mtime changes. Loading another image drops those of images no workflow is running on.
+        self._contexts: Dict[str, _ImageContext] = {}
+        self._contexts_lock = threading.Lock()
+        # Fingerprints of the images of running workflows, taken once per run
+        self._image_stats: Dict[str, Optional[Dict[str, Any]]] = {}
+        # Worker pools shared by every workflow run on this executor, created on first use
+        self._thread_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _ensure_cli(self) -> bool:
+        """Whether a vol CLI is available, probing for one on first use."""
+        if self._volatility_available is None:
+            vol_command = _probe_vol_command()
+            self._vol_command = list(vol_command or ())
+            self._volatility_available = vol_command is not None
+        return self._volatility_available
+
+    @staticmethod
+    def _resolve_executor_kind(executor_kind: str) -> str:
+        """Validate the configured worker pool kind."""
+        if executor_kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unsupported executor kind: {executor_kind}")
+        return executor_kind
+
+    def shutdown(self) -> None:
+        """Stop retrying plugins and release the worker pools and image contexts.
+
+        Pending backoff waits return immediately; queued plugins are cancelled. The executor
+        can't be used afterwards: running plugins or workflows on it raises RuntimeError.
+        """
+        self._stop.set()
+        with self._pool_lock:
+            pools = [pool for pool in (self._thread_pool, self._process_pool) if pool]
+            self._thread_pool = self._process_pool = None
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+        with self._contexts_lock:
+            self._contexts.clear()
+
+    def _check_open(self) -> None:
+        """Raise if shutdown() was called; retries could no longer back off."""
+        if self._stop.is_set():
+            raise RuntimeError("executor is shut down")
+
+    def __enter__(self) -> "Executor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
 
     def _execute_volatility_plugin(
         self, plugin_name: str, image_path: str, **kwargs: Any
     ) -> Tuple[Optional[List[Dict[str, Any]]], int]:
         """Execute a Volatility 3 plugin using Python API."""
         if not VOLATILITY_AVAILABLE:
-            raise RuntimeError("Volatility 3 Python API not available")
+            if not _cfg.config.volatility_cli_fallback:
+                raise RuntimeError("Volatility 3 Python API not available")
+            return self._execute_volatility_plugin_cli(plugin_name, image_path, **kwargs)
 
         # Use Python API for better integration
         try:
-            # Create context and configure
-            ctx = contexts.Context()  # type: ignore
-            ctx.config["automagic.LayerStacker.single_location"] = f"file://{image_path}"
-
-            # Import plugin files and build list (mirror CLI behavior)
-            failures = framework.import_files(volatility3.plugins, True)  # type: ignore
-            if failures:
-                logger.debug("Volatility plugin import failures: %s", failures)
-            plugin_list = framework.list_plugins()
-
-            # Resolve plugin name to the plugin class/type expected by volatility3
-            plugin_class = plugin_list.get(plugin_name)
-            if plugin_class is None:
-                # Try to find plugin by partial name match
-                # (e.g., 'windows.pslist' -> 'windows.pslist.PsList')
-                matching_plugins = [
-                    name for name in plugin_list.keys() if plugin_name in name.lower()
-                ]
-                if matching_plugins:
-                    # Take the first match (should be the most relevant)
-                    plugin_name_full = matching_plugins[0]
-                    plugin_class = plugin_list[plugin_name_full]
-                    logger.info(f"Resolved plugin name '{plugin_name}' to '{plugin_name_full}'")
-                else:
-                    raise RuntimeError(f"Could not find Volatility plugin: {plugin_name}")
+            return self._run_api_plugin(plugin_name, image_path), 1
+        except Exception as e:
+            if not _cfg.config.volatility_cli_fallback:
+                raise RuntimeError(f"Volatility 3 Python API failed for {plugin_name}: {e}") from e
+            logger.warning("Volatility 3 Python API failed: %s", e)
+            logger.info("Falling back to CLI method")
+            return self._execute_volatility_plugin_cli(plugin_name, image_path, **kwargs)
+
+    def _run_api_plugin(self, plugin_name: str, image_path: str) -> List[Dict[str, Any]]:
+        """Run a plugin in-process and return its rows; raises on any failure."""
+        plugin_list = _get_plugin_list()
+
+        # Resolve plugin name to the plugin class/type expected by volatility3
+        plugin_name_full = _resolve_plugin_name(plugin_name)
+        if plugin_name_full is None:
+            raise RuntimeError(f"Could not find Volatility plugin: {plugin_name}")
+        if plugin_name_full != plugin_name:
+            logger.debug("Resolved plugin name '%s' to '%s'", plugin_name, plugin_name_full)
+        plugin_class = plugin_list[plugin_name_full]
+        # Stacked layers are only shared between plugins for the same OS
+        family = plugin_name_full.split(".", 1)[0]
+
+        # Configuration stacked for this image by earlier plugins
+        image_ctx = self._image_context(image_path)
+        config_path = f"plugins.{plugin_class.__name__}"
+
+        def _noop_progress(progress, msg):
+            return None
 
-            # Get available automagics (returns list of classes)
-            automagic_classes = automagic.available(ctx)  # type: ignore
+        with image_ctx.lock:
+            ctx = image_ctx.new_context()
+            image_ctx.reuse_stacked(ctx, family, plugin_class, config_path)
 
-            # Choose appropriate automagics for the plugin (pass the plugin class/type)
-            assert automagic is not None  # VOLATILITY_AVAILABLE ensures this
-            chosen_automagics = automagic.choose_automagic(automagic_classes, plugin_class)  # type: ignore
+            # Only the automagics chosen for the plugin are instantiated
+            chosen_automagics = _choose_automagics(ctx, plugin_class)
 
-            # Construct plugin (pass the plugin class/type, and follow construct_plugin signature)
             # construct_plugin(ctx, automagics, plugin, base_config_path, progress_callback, open_method)  # noqa: E501
-            # For our use, we can pass an empty base_config_path and a simple progress callback
-            def _noop_progress(progress, msg):
-                return None
-
-            constructed = plugins.construct_plugin(
+            plugin = plugins.construct_plugin(
                 ctx,
                 chosen_automagics,
                 plugin_class,
@@ -133,140 +673,70 @@ class Executor:
                 _noop_progress,
                 plugins.__dict__.get("FileHandler", None),
             )
-
-            plugin = constructed
-
-            # Run plugin
-            treegrid = plugin.run()
-
-            # Convert treegrid to list of dicts
-            result = []
-            for row in treegrid.get_renderable().rows:  # type: ignore
-                result.append(dict(row))
-
-            return result, 1
-
-        except Exception as e:
-            logger.warning("Volatility 3 Python API failed: %s", e)
-            logger.info("Falling back to CLI method")
-            return self._execute_volatility_plugin_cli(plugin_name, image_path, **kwargs)
+            image_ctx.remember_stacked(ctx, family, plugin_class, config_path)
+
+        # Run and render outside the lock: the context belongs to this plugin alone
+        treegrid = plugin.run()
+        return _treegrid_rows(treegrid)
+
+    def _image_context(self, image_path: str) -> _ImageContext:
+        """Return the stacked configuration shared by the plugins run against an image."""
+        fingerprint = self._image_stat(image_path)
+        with self._contexts_lock:
+            # Configuration for other images is only kept while a workflow uses them
+            for other in [path for path in self._contexts if path != image_path]:
+                if other not in self._image_stats:
+                    del self._contexts[other]
+            image_ctx = self._contexts.get(image_path)
+            if image_ctx is None or image_ctx.fingerprint != fingerprint:
+                image_ctx = _ImageContext(image_path, fingerprint)
+                self._contexts[image_path] = image_ctx
+        return image_ctx
 
     def _execute_volatility_plugin_cli(
         self, plugin_name: str, image_path: str, **kwargs: Any
     ) -> Tuple[Optional[List[Dict[str, Any]]], int]:
         """Execute a Volatility 3 plugin using CLI as fallback."""
-        if not self._volatility_available:
+        if not self._ensure_cli():
             raise RuntimeError("Volatility 3 CLI not available")
 
         # Adjust timeout based on image size for large images
         image_size_gb = self._get_image_size_gb(image_path)
         timeout_seconds = self._calculate_timeout(image_size_gb)
 
-        logger.info(f"Image size: {image_size_gb:.2f} GB, using timeout: {timeout_seconds}s")
+        logger.info("Image size: %.2f GB, using timeout: %ss", image_size_gb, timeout_seconds)
 
         # Retry loop for transient failures
-        attempts = max(1, getattr(config, "volatility_retry_attempts", 1))
-        backoff = float(getattr(config, "volatility_retry_backoff_seconds", 0))
-        attempts_taken = 0
-        for attempt in range(1, attempts + 1):
-            try:
-                # Build command - Volatility 3 auto-detects symbol tables
-                cmd = self._vol_command + ["-f", image_path, "-r", "json"]
-
-                # Add plugin dirs (-p) and symbol dirs (-s) if configured
-                try:
-                    plugin_dirs = getattr(config, "plugin_dirs", []) or []
-                    if plugin_dirs:
-                        # Join with OS path separator
-                        import os
-
-                        cmd += ["-p", os.pathsep.join(str(p) for p in plugin_dirs)]
-                except Exception:
-                    pass
-                if getattr(config, "symbols_path", None):
-                    cmd += ["-s", str(config.symbols_path)]
-
-                # Add plugin name
-                cmd.append(plugin_name)
-
-                # Add any additional parameters
-                for key, value in kwargs.items():
-                    if isinstance(value, bool):
-                        if value:
-                            cmd.append(f"--{key}")
-                    else:
-                        cmd.append(f"--{key}={value}")
-
-                logger.info("Running command: %s", " ".join(cmd))
-
-                # Execute command
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout_seconds,  # Use dynamic timeout
-                    cwd=None,  # Use current directory
-                )
-
-                if result.returncode != 0:
-                    # Non-zero return code - treat as possible transient failure
-                    logger.warning(
-                        "Volatility plugin %s failed (attempt %d/%d): %s",
-                        plugin_name,
-                        attempt,
-                        attempts,
-                        result.stderr,
-                    )
-                    log_event(
-                        "plugin_retry",
-                        {"plugin": plugin_name, "attempt": attempt, "reason": result.stderr},
-                    )
-                    # If more attempts remain, retry (sleep only if backoff > 0)
-                    if attempt < attempts:
-                        if backoff > 0:
-                            time.sleep(backoff * (2 ** (attempt - 1)))
-                        continue
-                    raise RuntimeError(
-                        f"Plugin {plugin_name} failed after {attempts} attempts: {result.stderr}"
-                    )
+        attempts = max(1, getattr(_cfg.config, "volatility_retry_attempts", 1))
+        backoff = float(getattr(_cfg.config, "volatility_retry_backoff_seconds", 0))
+        # Total time this plugin may spend backing off, whatever the attempt count
+        backoff_budget = float(getattr(_cfg.config, "volatility_retry_total_seconds", 30.0))
+        backoff_spent = 0.0
+
+        def _wait_before_retry(attempt: int) -> bool:
+            """Back off before the next attempt; False when no retry should follow."""
+            nonlocal backoff_spent
+            if attempt >= attempts:
+                return False
+            if backoff <= 0:
+                return True
+            delay = min(backoff * (1 << (attempt - 1)), backoff_budget - backoff_spent)
+            if delay <= 0:
+                return False
+            backoff_spent += delay
+            # Returns early (and stops retrying) once the executor is shut down
+            return not self._stop.wait(delay)
 
-                # Parse JSON output
-                try:
-                    output_data = json.loads(result.stdout)
-                except json.JSONDecodeError as e:
-                    logger.warning("Failed to parse JSON output from %s: %s", plugin_name, e)
-                    log_event(
-                        "plugin_retry",
-                        {"plugin": plugin_name, "attempt": attempt, "reason": "json_error"},
-                    )
-                    logger.debug("Raw output: %s", result.stdout[:500])
-                    if attempt < attempts:
-                        if backoff > 0:
-                            time.sleep(backoff * (2 ** (attempt - 1)))
-                        continue
-                    raise RuntimeError(
-                        f"Plugin {plugin_name} failed to parse JSON after {attempts} attempts"
-                    )
-
-                # Volatility 3 JSON output is usually wrapped in a structure
-                # Extract the actual data
-                if isinstance(output_data, dict):
-                    # Find the data array - it might be under different keys
-                    for key, value in output_data.items():
-                        if isinstance(value, list) and value and isinstance(value[0], dict):
-                            attempts_taken = attempt
-                            return value, attempts_taken
-                    # If no list found, return empty list
-                    attempts_taken = attempt
-                    return [], attempts_taken
-                elif isinstance(output_data, list):
-                    attempts_taken = attempt
-                    return output_data, attempts_taken
-                else:
-                    logger.warning("Unexpected output format from %s", plugin_name)
-                    attempts_taken = attempt
-                    raise RuntimeError(f"Plugin {plugin_name} returned unexpected output format")
+        # The command is the same for every attempt
+        cmd = self._build_vol_command(plugin_name, image_path, kwargs)
 
+        for attempt in range(1, attempts + 1):
+            if events_enabled():
+                log_event("vol_exec", {"plugin": plugin_name, "attempt": attempt, "argv": cmd})
+            # Every failure below sets the retry event's reason and the error raised once
+            # no attempts remain
+            try:
+                returncode, output_data, parse_error, stderr = self._run_vol(cmd, timeout_seconds)
             except subprocess.TimeoutExpired as e:
                 logger.error(
                     "Volatility plugin %s timed out (attempt %d/%d)",
@@ -274,15 +744,8 @@ class Executor:
                     attempt,
                     attempts,
                 )
-                log_event(
-                    "plugin_retry",
-                    {"plugin": plugin_name, "attempt": attempt, "reason": str(e)},
-                )
-                if attempt < attempts:
-                    if backoff > 0:
-                        time.sleep(backoff * (2 ** (attempt - 1)))
-                    continue
-                raise RuntimeError(f"Plugin {plugin_name} timed out after {attempts} attempts")
+                reason = str(e)
+                failure = f"Plugin {plugin_name} timed out after {attempt} attempts"
             except Exception as e:
                 logger.error(
                     "Failed to execute Volatility plugin %s (attempt %d/%d): %s",
@@ -291,22 +754,278 @@ class Executor:
                     attempts,
                     e,
                 )
-                if attempt < attempts:
-                    if backoff > 0:
-                        time.sleep(backoff * (2 ** (attempt - 1)))
-                    continue
-                raise RuntimeError(f"Plugin {plugin_name} failed after {attempts} attempts: {e}")
+                reason = str(e)
+                failure = f"Plugin {plugin_name} failed after {attempt} attempts: {e}"
+            else:
+                if returncode != 0:
+                    # Non-zero return code - treat as possible transient failure
+                    logger.warning(
+                        "Volatility plugin %s failed (attempt %d/%d): %s",
+                        plugin_name,
+                        attempt,
+                        attempts,
+                        stderr,
+                    )
+                    reason = stderr
+                    failure = f"Plugin {plugin_name} failed after {attempt} attempts: {stderr}"
+                elif parse_error is not None:
+                    logger.warning(
+                        "Failed to parse JSON output from %s: %s", plugin_name, parse_error
+                    )
+                    reason = "json_error"
+                    failure = f"Plugin {plugin_name} failed to parse JSON after {attempt} attempts"
+                elif isinstance(output_data, list):
+                    return output_data, attempt
+                elif isinstance(output_data, dict):
+                    # Volatility 3 JSON output is sometimes wrapped in a structure
+                    return self._unwrap_rows(plugin_name, output_data), attempt
+                else:
+                    logger.warning("Unexpected output format from %s", plugin_name)
+                    reason = "unexpected_format"
+                    failure = f"Plugin {plugin_name} returned unexpected output format"
+
+            log_event("plugin_retry", {"plugin": plugin_name, "attempt": attempt, "reason": reason})
+            # If more attempts remain, retry (sleep only if backoff > 0)
+            if not _wait_before_retry(attempt):
+                raise RuntimeError(failure)
 
         # This should not be reached, as the loop either succeeds or raises an exception
 
-    def _get_image_size_gb(self, image_path: str) -> float:
-        """Get image file size in GB."""
+    def _unwrap_rows(self, plugin_name: str, output_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Extract the rows from a wrapped JSON document, or [] if it holds none."""
+        # Try the key this plugin's rows were under last time, then scan
+        key = self._data_keys.get(plugin_name)
+        rows = output_data.get(key) if key is not None else None
+        if _is_row_list(rows):
+            return rows  # type: ignore[return-value]
+        key, rows = next(
+            ((k, v) for k, v in output_data.items() if _is_row_list(v)),
+            (None, []),
+        )
+        if key is not None:
+            self._data_keys[plugin_name] = key
+        return rows  # type: ignore[return-value]
+
+    def iter_plugin_rows(
+        self,
+        plugin_name: str,
+        image_path: Union[str, Path],
+        session_id: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield a plugin's rows, streaming them from vol when the CLI has to be used.
+
+        Plugins run in-process through the Python API, like execute_plugin. When the CLI
+        fallback is enabled and the API is unavailable or fails, rows stream from the vol CLI
+        for callers that can act on partial results, one at a time when ijson is installed.
+        There are no retries or mock fallback, since rows may already have been handed out
+        when a run fails. A complete run is cached under the same key as execute_plugin, and
+        cached results are replayed.
+        """
+        self._check_open()
+        image_path = os.fspath(image_path)
+        cache_session_id = session_id or "default"
+        cache_key_params = self._cache_params(image_path, kwargs)
+        cache = get_cache()
+        cache_key = cache.make_key(cache_session_id, plugin_name, cache_key_params)
+
+        cached_result = cache.get(
+            cache_session_id, plugin_name, cache_key_params, cache_key=cache_key
+        )
+        if cached_result is not None:
+            yield from cached_result
+            return
+
+        cli_fallback = _cfg.config.volatility_cli_fallback
+        if VOLATILITY_AVAILABLE:
+            try:
+                rows = self._run_api_plugin(plugin_name, image_path)
+            except Exception as e:
+                if not cli_fallback:
+                    raise RuntimeError(
+                        f"Volatility 3 Python API failed for {plugin_name}: {e}"
+                    ) from e
+                logger.warning("Volatility 3 Python API failed: %s", e)
+            else:
+                cache.set(
+                    cache_session_id, plugin_name, cache_key_params, rows, cache_key=cache_key
+                )
+                yield from rows
+                return
+        elif not cli_fallback:
+            raise RuntimeError("Volatility 3 Python API not available")
+
+        if not self._ensure_cli():
+            raise RuntimeError("Volatility 3 CLI not available")
+
+        cmd = self._build_vol_command(plugin_name, image_path, kwargs)
+        timeout_seconds = self._calculate_timeout(self._get_image_size_gb(image_path))
+        rows = []
+        with (
+            tempfile.TemporaryFile() as stderr_file,
+            subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                bufsize=PIPE_BUFFER_SIZE,
+            ) as proc,
+        ):
+            timer = threading.Timer(timeout_seconds, proc.kill)
+            timer.start()
+            parse_error: Optional[Exception] = None
+            try:
+                try:
+                    for row in _iter_json_rows(proc.stdout):  # type: ignore[arg-type]
+                        rows.append(row)
+                        yield row
+                except _JSON_ERRORS as e:
+                    parse_error = e
+                    # Drain the rest so vol is not blocked writing to a full pipe
+                    while proc.stdout.read1(PIPE_BUFFER_SIZE):  # type: ignore[union-attr]
+                        pass
+                returncode = proc.wait()
+            except BaseException:
+                # Includes the caller closing the generator early
+                proc.kill()
+                raise
+            finally:
+                timer.cancel()
+
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", "replace")
+                raise RuntimeError(f"Plugin {plugin_name} failed: {stderr}")
+            if parse_error is not None:
+                raise RuntimeError(f"Plugin {plugin_name} produced invalid JSON: {parse_error}")
+
+        cache.set(cache_session_id, plugin_name, cache_key_params, rows, cache_key=cache_key)
+
+    def _build_vol_command(
+        self, plugin_name: str, image_path: str, kwargs: Dict[str, Any]
+    ) -> List[str]:
+        """Build the vol argv for one plugin run."""
+        # Build command - Volatility 3 auto-detects symbol tables
+        cmd = [*self._vol_command, "-f", image_path, "-r", "json"]
+
+        # Add plugin dirs (-p) and symbol dirs (-s) if configured
         try:
-            from pathlib import Path
+            plugin_dirs = getattr(_cfg.config, "plugin_dirs", []) or []
+            if plugin_dirs:
+                # Join with OS path separator
+                cmd += ["-p", os.pathsep.join(str(p) for p in plugin_dirs)]
+        except Exception:
+            pass
+        if getattr(_cfg.config, "symbols_path", None):
+            cmd += ["-s", str(_cfg.config.symbols_path)]
+
+        # Add plugin name and any additional parameters; True is a bare flag, False omits it
+        cmd.append(plugin_name)
+        cmd += [
+            f"--{key}" if value is True else f"--{key}={value}"
+            for key, value in kwargs.items()
+            if value is not False
+        ]
+        return cmd
+
+    def _run_vol(
+        self, cmd: List[str], timeout_seconds: float
+    ) -> Tuple[int, Any, Optional[Exception], str]:
+        """Run vol and parse its JSON stdout.
+
+        Returns the exit code, the parsed output, the parse error if any, and stderr. stderr
+        is only read back and decoded when vol fails.
+        """
+        # stderr goes to a temp file so progress output can never fill a pipe and stall vol
+        with tempfile.TemporaryFile() as stderr_file:
+            if IJSON_AVAILABLE:
+                returncode, output_data, parse_error = self._run_vol_streaming(
+                    cmd, timeout_seconds, stderr_file
+                )
+            else:
+                returncode, output_data, parse_error = self._run_vol_spooled(
+                    cmd, timeout_seconds, stderr_file
+                )
 
-            return Path(image_path).stat().st_size / (1024**3)
-        except (OSError, AttributeError):
-            return 0.0
+            stderr = ""
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", "replace")
+        return returncode, output_data, parse_error, stderr
+
+    def _run_vol_streaming(
+        self, cmd: List[str], timeout_seconds: float, stderr_file: IO[bytes]
+    ) -> Tuple[int, Any, Optional[Exception]]:
+        """Parse vol's stdout row by row from a pipe while the process is still writing it."""
+        with subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            bufsize=PIPE_BUFFER_SIZE,
+        ) as proc:
+            timed_out = threading.Event()
+
+            def _kill() -> None:
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(timeout_seconds, _kill)
+            timer.start()
+            try:
+                output_data: Any = None
+                parse_error: Optional[Exception] = None
+                try:
+                    output_data = _load_json_stream(proc.stdout)  # type: ignore[arg-type]
+                except _JSON_ERRORS as e:
+                    parse_error = e
+                    # Drain the rest so vol is not blocked writing to a full pipe
+                    while proc.stdout.read1(PIPE_BUFFER_SIZE):  # type: ignore[union-attr]
+                        pass
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout_seconds)
+        return returncode, output_data, parse_error
+
+    def _run_vol_spooled(
+        self, cmd: List[str], timeout_seconds: float, stderr_file: IO[bytes]
+    ) -> Tuple[int, Any, Optional[Exception]]:
+        """Let vol write stdout to a temp file, then parse the file through a mapping.
+
+        Used when the document has to be parsed whole anyway: nothing is copied through a
+        pipe or grown in a Python buffer.
+        """
+        with tempfile.TemporaryFile() as stdout_file:
+            with subprocess.Popen(
+                cmd, stdin=subprocess.DEVNULL, stdout=stdout_file, stderr=stderr_file
+            ) as proc:
+                try:
+                    returncode = proc.wait(timeout=timeout_seconds)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    raise
+            try:
+                return returncode, _load_json_file(stdout_file), None
+            except _JSON_ERRORS as e:
+                return returncode, None, e
+
+    def _image_stat(self, image_path: str) -> Optional[Dict[str, Any]]:
+        """Fingerprint of an image; taken once per workflow run, else on every call."""
+        if image_path in self._image_stats:
+            return self._image_stats[image_path]
+        return _image_fingerprint(image_path)
+
+    def _cache_params(self, image_path: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache key parameters of a plugin run; the image is identified by its fingerprint."""
+        return {"image_path": image_path, "image": self._image_stat(image_path), **parameters}
+
+    def _get_image_size_gb(self, image_path: str) -> float:
+        """Get image file size in GB."""
+        fingerprint = self._image_stat(image_path)
+        return fingerprint["size"] / (1024**3) if fingerprint else 0.0
 
     def _calculate_timeout(self, image_size_gb: float) -> int:
         """Calculate appropriate timeout based on image size."""
@@ -331,19 +1050,25 @@ class Executor:
         **kwargs: Any,
     ) -> ExecutionResult:
         """Execute a single Volatility plugin."""
-        start_time = time.time()
-        timestamp = start_time
+        self._check_open()
+        # Wall clock for the result's timestamp; cache hits need no other clock
+        timestamp = time.time()
 
         # Use session_id or default
         cache_session_id = session_id or "default"
 
-        cache_key_params = {"image_path": image_path, **kwargs}
+        cache_key_params = self._cache_params(image_path, kwargs)
+        # Hashed once and shared by the lookup and the store below
+        cache = get_cache()
+        cache_key = cache.make_key(cache_session_id, plugin_name, cache_key_params)
 
         # Check cache first, unless force_reexecute is True
         if not force_reexecute:
-            cached_result = cache.get(cache_session_id, plugin_name, cache_key_params)
+            cached_result = cache.get(
+                cache_session_id, plugin_name, cache_key_params, cache_key=cache_key
+            )
             if cached_result is not None:
-                logger.info(f"Using cached result for {plugin_name}")
+                logger.info("Using cached result for %s", plugin_name)
                 return ExecutionResult(
                     plugin_name=plugin_name,
                     success=True,
@@ -355,55 +1080,45 @@ class Executor:
                     used_mock=False,  # Cached results are real, not mock
                 )
         else:
-            logger.info(f"Force re-executing {plugin_name}, bypassing cache.")
-
-        try:
-            log_event("plugin_start", {"plugin": plugin_name, "image": image_path})
-
-            # Execute real Volatility 3 plugin
-            output, attempts_taken = self._execute_volatility_plugin(
-                plugin_name, image_path, **kwargs
-            )
-
-            # Cache the result (store only the output)
-            cache.set(cache_session_id, plugin_name, cache_key_params, output)
+            logger.info("Force re-executing %s, bypassing cache.", plugin_name)
 
-            success = True
-            error = None
-            used_mock = False
-            log_event(
-                "plugin_success", {"plugin": plugin_name, "duration": time.time() - start_time}
+        # Durations come from a monotonic clock and are read once, at the end
+        start_ns = time.perf_counter_ns()
+        attempts_taken = 0
+        # The CLI is only probed for (possibly through poetry) when it may be used
+        if not (
+            VOLATILITY_AVAILABLE or (_cfg.config.volatility_cli_fallback and self._ensure_cli())
+        ):
+            # Neither the Python API nor the CLI can run; go straight to the fallback
+            output, success, error, used_mock = self._fallback_output(
+                plugin_name, "Volatility 3 is not available"
             )
+        else:
+            try:
+                if events_enabled():
+                    log_event("plugin_start", {"plugin": plugin_name, "image": image_path})
 
-        except Exception as e:
-            # For security-sensitive plugins, avoid mock fallback to prevent misleading data
-            sensitive_plugins = {"windows.hashdump", "windows.cachedump", "windows.lsadump"}
-            if any(name in plugin_name for name in sensitive_plugins):
-                logger.warning(
-                    f"Volatility execution failed for {plugin_name}, not using mock: {e}"
+                # Execute real Volatility 3 plugin
+                output, attempts_taken = self._execute_volatility_plugin(
+                    plugin_name, image_path, **kwargs
                 )
-                output = []
-                success = False
-                error = str(e)
-                used_mock = False
-                attempts_taken = int(locals().get("attempts_taken", 0))
-                log_event("plugin_failure", {"plugin": plugin_name, "error": str(e)})
-            else:
-                # Fallback to mock data when Volatility fails (ADR-0004)
-                logger.warning(
-                    f"Volatility execution failed for {plugin_name}, using mock data: {e}"
+
+                # Cache the result (store only the output)
+                cache.set(
+                    cache_session_id, plugin_name, cache_key_params, output, cache_key=cache_key
                 )
-                output = self._generate_mock_data(plugin_name)
-                success = True  # Mock data is considered successful
+
+                success = True
                 error = None
-                used_mock = True
-                attempts_taken = 0  # Mock doesn't use attempts
-                log_event("plugin_mock_fallback", {"plugin": plugin_name, "error": str(e)})
+                used_mock = False
 
-        duration = time.time() - start_time
+            except Exception as e:
+                output, success, error, used_mock = self._fallback_output(plugin_name, str(e))
+                attempts_taken = 0
 
-        # Ensure attempts is set even on exceptions/cached results
-        attempts_value = int(locals().get("attempts_taken", 0))
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+        if success and not used_mock and events_enabled():
+            log_event("plugin_success", {"plugin": plugin_name, "duration": duration})
 
         return ExecutionResult(
             plugin_name=plugin_name,
@@ -412,40 +1127,94 @@ class Executor:
             error=error,
             duration=duration,
             timestamp=timestamp,
-            attempts=attempts_value,
+            attempts=attempts_taken,
             used_mock=used_mock,
         )
 
+    def _fallback_output(
+        self, plugin_name: str, error: str
+    ) -> Tuple[List[Dict[str, Any]], bool, Optional[str], bool]:
+        """Output, success, error and used_mock for a plugin Volatility could not run."""
+        # For security-sensitive plugins, avoid mock fallback to prevent misleading data
+        sensitive_plugins = {"windows.hashdump", "windows.cachedump", "windows.lsadump"}
+        if any(name in plugin_name for name in sensitive_plugins):
+            logger.warning(
+                "Volatility execution failed for %s, not using mock: %s", plugin_name, error
+            )
+            log_event("plugin_failure", {"plugin": plugin_name, "error": error})
+            return [], False, error, False
+
+        # Fallback to mock data when Volatility fails (ADR-0004); mock doesn't use attempts
+        logger.warning(
+            "Volatility execution failed for %s, using mock data: %s", plugin_name, error
+        )
+        log_event("plugin_mock_fallback", {"plugin": plugin_name, "error": error})
+        # Mock data is considered successful
+        return self._generate_mock_data(plugin_name), True, None, True
+
     def execute_workflow(
-        self, workflow_spec: Any, image_path: str, force_reexecute: bool = False
+        self,
+        workflow_spec: Any,
+        image_path: Union[str, Path],
+        force_reexecute: bool = False,
+        session_id: Optional[str] = None,
     ) -> List[ExecutionResult]:
         """Execute all plugins in a workflow."""
+        self._check_open()
+        image_path = os.fspath(image_path)
+        # Stat the image once for the run; plugins reuse it for timeouts and cache keys
+        self._image_stats[image_path] = _image_fingerprint(image_path)
+        try:
+            return self._execute_workflow(workflow_spec, image_path, force_reexecute, session_id)
+        finally:
+            self._image_stats.pop(image_path, None)
+
+    def _execute_workflow(
+        self,
+        workflow_spec: Any,
+        image_path: str,
+        force_reexecute: bool,
+        session_id: Optional[str],
+    ) -> List[ExecutionResult]:
         results: List[ExecutionResult] = []
 
         # Detect OS to filter compatible plugins
         detected_os = self._detect_os(image_path)
         if detected_os:
-            logger.info(f"Detected OS: {detected_os}")
+            logger.info("Detected OS: %s", detected_os)
+            # Keep plugins for the detected OS and plugins not tied to any OS
             plugins_to_run = [
                 plugin
                 for plugin in workflow_spec.plugins
-                if plugin.name.startswith(f"{detected_os}.")
-                or not any(plugin.name.startswith(f"{os}.") for os in ["windows", "linux", "mac"])
+                if (family := plugin.name.split(".", 1)[0]) == detected_os
+                or family not in OS_FAMILIES
             ]
             if len(plugins_to_run) != len(workflow_spec.plugins):
                 filtered = len(workflow_spec.plugins) - len(plugins_to_run)
-                logger.info(f"Filtered {filtered} incompatible plugins")
+                logger.info("Filtered %d incompatible plugins", filtered)
         else:
             logger.warning("Could not detect OS, executing all plugins (may fail)")
             plugins_to_run = list(workflow_spec.plugins)
 
+        # Identical specs (same plugin and parameters) run once and share the result
+        spec_keys = [_spec_key(plugin) for plugin in plugins_to_run]
+        unique_specs: Dict[Tuple[str, str], Any] = {}
+        for key, plugin in zip(spec_keys, plugins_to_run):
+            unique_specs.setdefault(key, plugin)
+        if len(unique_specs) != len(plugins_to_run):
+            logger.info(
+                "Running %d duplicate plugin specs once", len(plugins_to_run) - len(unique_specs)
+            )
+            plugins_to_run = list(unique_specs.values())
+
         # Adjust concurrency based on image size for large images
         image_size_gb = self._get_image_size_gb(image_path)
         if image_size_gb > 2.0:  # For images > 2GB, reduce concurrency
             adjusted_concurrency = max(1, self.max_concurrency // 2)
             logger.info(
-                f"Large image detected ({image_size_gb:.2f} GB), "
-                f"reducing concurrency to {adjusted_concurrency}"
+                "Large image detected (%.2f GB), reducing concurrency to %d",
+                image_size_gb,
+                adjusted_concurrency,
             )
         else:
             adjusted_concurrency = self.max_concurrency
@@ -453,199 +1222,212 @@ class Executor:
         # For very large images (> 4GB), execute sequentially to avoid memory pressure
         if image_size_gb > 4.0:
             logger.info(
-                f"Very large image detected ({image_size_gb:.2f} GB), "
-                "executing plugins sequentially"
+                "Very large image detected (%.2f GB), executing plugins sequentially",
+                image_size_gb,
             )
             for plugin in plugins_to_run:
                 result = self.execute_plugin(
                     plugin.name,
                     image_path,
+                    session_id=session_id,
                     force_reexecute=force_reexecute,
                     **plugin.parameters,
                 )
                 results.append(result)
         else:
-            # Use thread pool for normal-sized images
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=adjusted_concurrency
-            ) as executor:
-                futures = []
-                future_to_index = {}
+            # Dispatch to the long-lived pool; the semaphore holds this workflow to its
+            # (possibly reduced) concurrency
+            pool = self._get_pool()
+            slots = threading.BoundedSemaphore(adjusted_concurrency)
+            # Cached results are read back on this thread; handing them to a worker costs
+            # more than the lookup itself
+            cache = get_cache()
+            inline_results: Dict[int, ExecutionResult] = {}
+            if not force_reexecute:
                 for i, plugin in enumerate(plugins_to_run):
-                    future = executor.submit(
-                        self.execute_plugin,
+                    if cache.contains(
+                        session_id or "default",
                         plugin.name,
-                        image_path,
-                        force_reexecute=force_reexecute,
-                        **plugin.parameters,
-                    )
-                    futures.append(future)
-                    future_to_index[future] = i
-
-                # Collect results in completion order, then sort by original order
-                completed_results = []
-                for future in concurrent.futures.as_completed(futures):
-                    result = future.result()
-                    index = future_to_index[future]
-                    completed_results.append((index, result))
-
-                # Sort by original order and extract just the results
-                completed_results.sort(key=lambda x: x[0])
-                results = [result for _, result in completed_results]
+                        self._cache_params(image_path, plugin.parameters),
+                    ):
+                        inline_results[i] = self.execute_plugin(
+                            plugin.name, image_path, session_id=session_id, **plugin.parameters
+                        )
+            futures: Dict[int, concurrent.futures.Future] = {}
+            for i, plugin in enumerate(plugins_to_run):
+                if i in inline_results:
+                    continue
+                slots.acquire()
+                try:
+                    if self.executor_kind == "process":
+                        # Bound methods don't pickle; workers build their own Executor
+                        future = pool.submit(
+                            _execute_plugin_worker,
+                            plugin.name,
+                            image_path,
+                            session_id,
+                            force_reexecute,
+                            plugin.parameters,
+                        )
+                    else:
+                        future = pool.submit(
+                            self.execute_plugin,
+                            plugin.name,
+                            image_path,
+                            session_id=session_id,
+                            force_reexecute=force_reexecute,
+                            **plugin.parameters,
+                        )
+                except BaseException:
+                    slots.release()
+                    raise
+                future.add_done_callback(lambda _: slots.release())
+                futures[i] = future
+
+            # Every result is needed, so waiting in plugin order keeps that order
+            results = [
+                futures[i].result() if i in futures else inline_results[i]
+                for i in range(len(plugins_to_run))
+            ]
 
-        return results
+        if len(results) == len(spec_keys):
+            return results
+        # Expand back to one result per spec; repeats get their own copy of the result
+        results_by_spec = dict(zip(unique_specs, results))
+        expanded = []
+        seen = set()
+        for key in spec_keys:
+            result = results_by_spec[key]
+            expanded.append(result.model_copy() if key in seen else result)
+            seen.add(key)
+        return expanded
+
+    def _get_thread_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return this executor's thread pool, created on first use."""
+        with self._pool_lock:
+            self._check_open()
+            if self._thread_pool is None:
+                self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_concurrency
+                )
+            return self._thread_pool
+
+    def _get_pool(self) -> concurrent.futures.Executor:
+        """Return the long-lived pool plugins are dispatched to, created on first use."""
+        if self.executor_kind != "process":
+            return self._get_thread_pool()
+        with self._pool_lock:
+            self._check_open()
+            if self._process_pool is None:
+                # Spawned, not forked: this process may have pool threads (OS probes,
+                # plugins) holding locks mid-run. Workers get this process's settings.
+                self._process_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(_cfg.config,),
+                )
+            return self._process_pool
 
     def _detect_os(self, image_path: str) -> Optional[str]:
-        """Detect the OS of the memory image."""
+        """Detect the OS of the memory image, cached per image fingerprint across runs."""
         if not VOLATILITY_AVAILABLE:
             return None
 
+        # Detections are kept in the result cache, keyed by the image's fingerprint
+        fingerprint = self._image_stat(image_path)
+        cache = get_cache()
+        if fingerprint is not None:
+            cached_os = cache.get(OS_DETECT_SESSION, "os", fingerprint)
+            if cached_os is not None:
+                logger.debug("Using cached OS detection for %s", image_path)
+                return cached_os
+
+        detected_os = self._run_os_probes(image_path)
+        if detected_os is not None and fingerprint is not None:
+            cache.set(OS_DETECT_SESSION, "os", fingerprint, detected_os)
+        return detected_os
+
+    def _run_os_probes(self, image_path: str) -> Optional[str]:
+        """Return the first OS, in windows/linux/mac order, whose info plugin fits the image.
+
+        The probes run in parallel on their own threads, so they never take plugin pool
+        slots. Once the answer is known, the probes still running are cancelled.
+        """
         os_plugins = {"windows": "windows.info", "linux": "linux.info", "mac": "mac.info"}
 
-        for os_name, plugin in os_plugins.items():
-            try:
-                # Try to run the info plugin
-                ctx = contexts.Context()
-                ctx.config["automagic.LayerStacker.single_location"] = f"file://{image_path}"
+        cancelled = threading.Event()
+        pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(os_plugins), thread_name_prefix="oroitz-os-probe"
+        )
+        futures = [
+            (os_name, pool.submit(self._probe_os, image_path, plugin, cancelled))
+            for os_name, plugin in os_plugins.items()
+        ]
+        try:
+            # A later OS only wins once every earlier one has failed
+            for os_name, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.debug("OS probe %s failed: %s", os_name, e)
+                    continue
+                return os_name
+        finally:
+            cancelled.set()
+            pool.shutdown(wait=False, cancel_futures=True)
 
-                automagic_classes = automagic.available(ctx)
-                chosen_automagics = automagic.choose_automagic(automagic_classes, plugin)
+        return None
 
-                for amagic in chosen_automagics:
-                    if amagic.__class__.__name__ == "LayerStacker":
-                        ctx.config["automagic.LayerStacker.single_location"] = (
-                            f"file://{image_path}"
-                        )
-                    amagic(ctx, config_path=config.config_file)
+    def _probe_os(self, image_path: str, plugin_name: str, cancelled: threading.Event) -> None:
+        """Construct an OS info plugin against the image; raises if the image is not that OS."""
+        plugin_name_full = _resolve_plugin_name(plugin_name)
+        if plugin_name_full is None:
+            raise RuntimeError(f"Could not find Volatility plugin: {plugin_name}")
+        plugin_class = _get_plugin_list()[plugin_name_full]
 
-                # Try to construct the plugin
-                plugins.construct_plugin(ctx, plugin)
-                # If no exception, OS detected
-                return os_name
-            except Exception:
-                continue
+        ctx = contexts.Context()  # type: ignore
+        ctx.config["automagic.LayerStacker.single_location"] = f"file://{image_path}"
+        chosen_automagics = _choose_automagics(ctx, plugin_class)
 
-        return None
+        def _progress(progress, msg):
+            # Scanning reports progress often; stop as soon as another probe has won
+            if cancelled.is_set():
+                raise RuntimeError("OS probe cancelled")
+
+        plugins.construct_plugin(ctx, chosen_automagics, plugin_class, "plugins", _progress, None)
 
     def _generate_mock_data(self, plugin_name: str) -> List[Dict[str, Any]]:
-        """Generate deterministic mock data for testing when Volatility is unavailable."""
-        if "pslist" in plugin_name:
-            return [
-                {
-                    "PID": 4,
-                    "PPID": 0,
-                    "ImageFileName": "System",
-                    "Offset(V)": "0x12345678",
-                    "Threads": 8,
-                    "Handles": 100,
-                    "SessionId": 0,
-                    "Wow64": False,
-                    "CreateTime": "2023-01-01T00:00:00.000000+00:00",
-                    "ExitTime": None,
-                },
-                {
-                    "PID": 1234,
-                    "PPID": 4,
-                    "ImageFileName": "smss.exe",
-                    "Offset(V)": "0x87654321",
-                    "Threads": 2,
-                    "Handles": 50,
-                    "SessionId": 0,
-                    "Wow64": False,
-                    "CreateTime": "2023-01-01T00:00:01.000000+00:00",
-                    "ExitTime": None,
-                },
-            ]
-        elif "netscan" in plugin_name:
-            return [
-                {
-                    "Offset(V)": "0xabcdef12",
-                    "PID": 1234,
-                    "Size": 123,
-                    "Proto": "TCPv4",
-                    "LocalAddr": "192.168.1.100",
-                    "LocalPort": 443,
-                    "ForeignAddr": "10.0.0.1",
-                    "ForeignPort": 80,
-                    "State": "ESTABLISHED",
-                    "Created": "2020-12-31T16:30:00.000000+00:00",  # String instead of int
-                    "Owner": "chrome.exe",
-                }
-            ]
-        elif "malfind" in plugin_name:
-            return [
-                {
-                    "PID": 5678,
-                    "Process": "suspicious.exe",
-                    "Start VPN": "0x400000",
-                    "End VPN": "0x500000",
-                    "Tag": "VadS",
-                    "Protection": "PAGE_EXECUTE_READWRITE",
-                    "CommitCharge": 1,
-                    "PrivateMemory": 4096,
-                    "FileOffset": 0,
-                    "FileName": None,
-                }
-            ]
-        elif "hashdump" in plugin_name:
-            return [
-                {
-                    "Username": "Administrator",
-                    "UID": 500,
-                    "GID": 500,
-                    "Hash": "aad3b435b51404eeaad3b435b51404ee:31d6cfe0d16ae931b73c59d7e0c089c0",
-                    "Type": "NTLM",
-                },
-                {
-                    "Username": "user1",
-                    "UID": 1000,
-                    "GID": 1000,
-                    "Hash": "e19ccf75ee54e06b06a5907af13cef42:31d6cfe0d16ae931b73c59d7e0c089c0",
-                    "Type": "NTLM",
-                },
-            ]
-        elif "lsadump" in plugin_name or "cachedump" in plugin_name:
-            return [
-                {
-                    "Username": "Administrator",
-                    "UID": 500,
-                    "GID": 500,
-                    "HomeDir": "/home/admin",
-                    "Shell": "/bin/bash",
-                    "Description": "Administrator account",
-                },
-                {
-                    "Username": "user1",
-                    "UID": 1000,
-                    "GID": 1000,
-                    "HomeDir": "/home/user1",
-                    "Shell": "/bin/bash",
-                    "Description": "Regular user",
-                },
-            ]
-        elif "getsids" in plugin_name:
-            return [
-                {
-                    "Name": "Administrator",
-                    "SID": "S-1-5-21-1367486129-1636748403-2738611465-500",
-                    "PID": 2496,
-                    "Process": "explorer.exe",
-                },
-                {
-                    "Name": "Domain Users",
-                    "SID": "S-1-5-21-1367486129-1636748403-2738611465-513",
-                    "PID": 2496,
-                    "Process": "explorer.exe",
-                },
-                {
-                    "Name": "Administrators",
-                    "SID": "S-1-5-32-544",
-                    "PID": 2496,
-                    "Process": "explorer.exe",
-                },
-            ]
-        else:
-            # Generic mock data for unknown plugins - return empty list
-            return []
+        """Return deterministic mock data for testing when Volatility is unavailable."""
+        return list(_mock_rows(plugin_name))
+
+
+# Executor kept by each process pool worker across tasks, so the Volatility plugins it
+# imported and the image contexts it stacked stay warm between plugins
+_worker_executor: Optional[Executor] = None
+
+
+def _init_worker(settings: Any) -> None:
+    """Install the parent's settings in a newly spawned process pool worker."""
+    _cfg.config = settings
+
+
+def _execute_plugin_worker(
+    plugin_name: str,
+    image_path: str,
+    session_id: Optional[str],
+    force_reexecute: bool,
+    parameters: Dict[str, Any],
+) -> ExecutionResult:
+    """Run one plugin in a process pool worker."""
+    global _worker_executor
+    # Workers run one task at a time, so no lock is needed
+    if _worker_executor is None:
+        _worker_executor = Executor()
+    return _worker_executor.execute_plugin(
+        plugin_name,
+        image_path,
+        session_id=session_id,
+        force_reexecute=force_reexecute,
+        **parameters,
+    )
@@ -7,7 +7,8 @@ from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
-from oroitz.core.executor import ExecutionResult
+# The module, not its lazy config attribute, so importing this does not load settings
+from oroitz.core import config as _cfg
 from oroitz.core.output import QuickTriageOutput
 
 
@@ -46,7 +47,6 @@ class Session(BaseModel):
     ) -> Optional["QuickTriageOutput"]:
         """Run a workflow and return normalized results."""
 
-        from oroitz.core.cache import Cache
         from oroitz.core.executor import Executor
         from oroitz.core.output import OutputNormalizer
         from oroitz.core.workflow import registry
@@ -62,34 +62,11 @@ class Session(BaseModel):
         if not registry.validate_compatibility(workflow_id):
             return None
 
-        executor = Executor()
         normalizer = OutputNormalizer()
-        cache = Cache()  # Uses default cache dir
-
-        results = []
-        for plugin_spec in workflow.plugins:
-            # Check cache first
-            cached = cache.get(self.id, plugin_spec.name, plugin_spec.parameters)
-            if cached is not None:
-                result = ExecutionResult(
-                    plugin_name=plugin_spec.name,
-                    success=True,
-                    output=cached,
-                    error=None,
-                    duration=0.0,
-                    timestamp=0.0,  # Not cached
-                )
-            else:
-                result = executor.execute_plugin(
-                    plugin_spec.name,
-                    str(self.image_path),
-                    session_id=self.id,
-                    **plugin_spec.parameters,
-                )
-                if result.success:
-                    cache.set(self.id, plugin_spec.name, plugin_spec.parameters, result.output)
-
-            results.append(result)
+
+        # Plugins run concurrently; cached results are looked up under this session's id
+        with Executor() as executor:
+            results = executor.execute_workflow(workflow, self.image_path, session_id=self.id)
 
         # For now, assume quick_triage
         if workflow_id == "quick_triage":
@@ -104,7 +81,7 @@ class SessionManager:
 
     def __init__(self, sessions_dir: Optional[Path] = None) -> None:
         """Initialize session manager."""
-        self.sessions_dir = sessions_dir or Path.home() / ".oroitz" / "sessions"
+        self.sessions_dir = sessions_dir or _cfg.config.sessions_dir
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
         self._sessions: dict[str, Session] = {}
         self._load_sessions()
@@ -15,8 +15,16 @@ logging.basicConfig(
 logger = logging.getLogger("oroitz")
 
 
+def events_enabled() -> bool:
+    """Whether log_event would log anything; lets hot paths skip building the payload."""
+    return logger.isEnabledFor(logging.INFO)
+
+
 def log_event(event: str, data: Dict[str, Any]) -> None:
     """Log a structured event as JSON for easier parsing."""
+    # Serializing the payload is the expensive part; skip it when INFO is filtered out
+    if not events_enabled():
+        return
     try:
         payload = {"event": event, **(data or {})}
         logger.info(json.dumps(payload, ensure_ascii=False))
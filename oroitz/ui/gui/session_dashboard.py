@@ -89,6 +89,9 @@ class WorkflowWorker(QThread):
         except Exception as e:
             self.execution_error.emit(f"Workflow execution failed: {str(e)}")
             self.log_message.emit(f"Error: {str(e)}")
+        finally:
+            # Release the worker pools and the image's layer stacks
+            self.executor.shutdown()
 
 
 class SessionDashboard(QWidget):
@@ -319,6 +322,8 @@ class SessionDashboard(QWidget):
         """Handle stop button click."""
         # Stop the worker thread if running
         if self.worker and self.worker.isRunning():
+            # Cancel queued plugins before the thread is killed
+            self.worker.executor.shutdown()
             self.worker.terminate()  # Force termination
             self.worker.wait()
             self.worker = None
@@ -46,6 +46,10 @@ class OroitzTUI(App):
         self.push_screen(HomeView())
         logger.info("TUI on_mount called")
 
+    def on_unmount(self) -> None:
+        """Release the executor's worker pools and image contexts on exit."""
+        self.executor.shutdown()
+
     def compose(self):
         """Compose the main application layout."""
         yield CommandPalette()
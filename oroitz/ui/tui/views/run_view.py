@@ -110,6 +110,10 @@ class RunView(Screen):
             cast(Static, self.query_one("#log-content")).update(self.log_text)
             self.notify(error_msg, severity="error")
 
+    def on_unmount(self) -> None:
+        """Release the executor's image contexts when the screen is closed."""
+        self.executor.shutdown()
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         button_id = event.button.id
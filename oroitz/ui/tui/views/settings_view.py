@@ -7,7 +7,7 @@ from textual.containers import Container, Vertical, VerticalScroll
 from textual.screen import Screen
 from textual.widgets import Button, Checkbox, Input, Label, Select, Static
 
-from oroitz.core.cache import cache
+from oroitz.core.cache import get_cache
 from oroitz.core.config import config
 from oroitz.core.telemetry import logger
 
@@ -95,5 +95,5 @@ class SettingsView(Screen):
 
     def _clear_cache(self) -> None:
         """Clear the application cache."""
-        cache.clear()
+        get_cache().clear()
         self.notify("Cache cleared", severity="information")
@@ -100,3 +100,18 @@ def test_cli_quick_triage_invalid_image():
 
     # Should fail due to missing file
     assert result.exit_code != 0
+
+
+def test_cli_quick_triage_workflow_not_found(monkeypatch, tmp_path):
+    """Test CLI quick_triage when the workflow is not registered."""
+    from oroitz.core.workflow import registry
+
+    monkeypatch.setattr(registry, "get", lambda workflow_id: None)
+    fake_image = tmp_path / "image.dmp"
+    fake_image.write_bytes(b"")
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["quick-triage", str(fake_image)])
+
+    assert result.exit_code == 0
+    assert "Quick triage workflow not found" in result.output
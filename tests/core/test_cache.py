@@ -3,6 +3,8 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from oroitz.core.cache import Cache
 
 
@@ -58,6 +60,29 @@ def test_cache_clear():
         assert cache.get("session1", "plugin2", {}) is None
 
 
+def test_cache_clear_tolerates_concurrent_removal():
+    """Entries removed by someone else mid-clear are skipped; orphaned temp files go too."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir))
+        cache.set("session1", "plugin1", {}, "data1")
+        cache.set("session1", "plugin2", {}, "data2")
+        # Left behind by a write that was interrupted before its rename
+        (Path(tmpdir) / "orphan.tmp").write_bytes(b"partial")
+
+        list_entries = cache._cache_entries
+
+        def listed_then_removed(**kwargs):
+            entries = list_entries(**kwargs)
+            # Another process clears the cache between the scan and the unlinks
+            Path(entries[0].path).unlink()
+            return entries
+
+        cache._cache_entries = listed_then_removed
+        cache.clear()
+
+        assert list(Path(tmpdir).iterdir()) == []
+
+
 def test_cache_stats():
     """Test cache statistics."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -75,3 +100,207 @@ def test_cache_stats():
         stats = cache.get_stats()
         assert stats["total_entries"] == 2
         assert stats["cache_size_mb"] > 0
+
+
+def test_cache_format_is_part_of_key():
+    """Entries written in one format are never looked up as another."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir), cache_format="json")
+        json_key = cache._get_cache_key("session1", "plugin1", {})
+
+        cache.cache_format = "msgpack"
+        assert cache._get_cache_key("session1", "plugin1", {}) != json_key
+
+
+def test_cache_msgpack_roundtrip():
+    """Test msgpack-backed cache entries."""
+    pytest.importorskip("msgpack")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir), cache_format="msgpack")
+        rows = [{"PID": 4, "ImageFileName": "System", "ExitTime": None}]
+        cache.set("session1", "windows.pslist", {}, rows)
+
+        assert cache.get("session1", "windows.pslist", {}) == rows
+        assert len(list(Path(tmpdir).glob("*.mpk"))) == 1
+        assert cache.get_stats()["total_entries"] == 1
+
+
+def test_cache_memory_layer():
+    """Results are served from memory; the least used entry is evicted first."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir))
+        cache.memory_entries = 2
+
+        cache.set("session1", "plugin1", {}, "data1")
+        cache.set("session1", "plugin2", {}, "data2")
+        cache.get("session1", "plugin1", {})
+        cache.set("session1", "plugin3", {}, "data3")
+
+        # plugin2 was used least (and less recently than plugin3) and has been evicted
+        assert len(cache._mem) == 2
+        assert cache._get_cache_key("session1", "plugin2", {}) not in cache._mem
+
+        # Memory hits do not touch the disk
+        for cache_file in Path(tmpdir).iterdir():
+            cache_file.unlink()
+        assert cache.get("session1", "plugin1", {}) == "data1"
+        assert cache.get("session1", "plugin2", {}) is None
+
+
+def test_cache_set_leaves_no_temp_files():
+    """Writes are atomic and do not leave temp files behind."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir))
+        cache.set("session1", "plugin1", {}, ["data1"])
+        # Unserializable results are skipped without leaving partial files
+        cache.set("session1", "plugin2", {}, object())
+
+        assert sorted(p.suffix for p in Path(tmpdir).iterdir()) == [".json", ".meta"]
+
+
+def test_cache_zstd_compression():
+    """Compressed entries round-trip and are counted in stats."""
+    pytest.importorskip("zstandard")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir))
+        cache.compress = True
+        rows = [{"PID": pid, "ImageFileName": "svchost.exe"} for pid in range(100)]
+        cache.set("session1", "windows.pslist", {}, rows)
+        cache._mem.clear()
+
+        assert cache.get("session1", "windows.pslist", {}) == rows
+        assert len(list(Path(tmpdir).glob("*.json.zst"))) == 1
+        assert cache.get_stats()["total_entries"] == 1
+
+
+def test_cache_large_entry_roundtrip(monkeypatch):
+    """Entries above the mmap threshold decode the same as small ones."""
+    import oroitz.core.cache as cache_module
+
+    monkeypatch.setattr(cache_module, "MMAP_THRESHOLD", 16)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir))
+        rows = [{"PID": pid, "ImageFileName": "svchost.exe"} for pid in range(100)]
+        cache.set("session1", "windows.pslist", {}, rows)
+        cache._mem.clear()
+
+        assert cache.get("session1", "windows.pslist", {}) == rows
+
+
+def test_cache_parallel_clear_and_stats(monkeypatch):
+    """Stats and clear give the same answers when fanned out to threads."""
+    import oroitz.core.cache as cache_module
+
+    monkeypatch.setattr(cache_module, "PARALLEL_IO_THRESHOLD", 2)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir))
+        for i in range(5):
+            cache.set("session1", f"plugin{i}", {}, f"data{i}")
+
+        assert cache.get_stats()["total_entries"] == 5
+        cache.clear()
+        assert cache.get_stats()["total_entries"] == 0
+
+
+def test_cache_stats_for_entry():
+    """Row counts are available from the sidecar without loading the entry."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir))
+        assert cache.stats_for("session1", "windows.pslist", {}) is None
+
+        cache.set("session1", "windows.pslist", {}, [{"PID": 4}, {"PID": 8}])
+        stats = cache.stats_for("session1", "windows.pslist", {})
+        assert stats["len"] == 2
+        assert stats["size"] > 0
+
+        # Sidecars are not entries, but are removed with them
+        assert cache.get_stats()["total_entries"] == 1
+        cache.clear()
+        assert list(Path(tmpdir).iterdir()) == []
+
+
+def test_cache_precomputed_key():
+    """A key from make_key addresses the same entry as the raw arguments."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir))
+        key = cache.make_key("session1", "windows.pslist", {"pid": 4})
+
+        cache.set("session1", "windows.pslist", {"pid": 4}, [1, 2], cache_key=key)
+        cache._mem.clear()
+
+        assert cache.get("session1", "windows.pslist", {"pid": 4}) == [1, 2]
+        assert cache.get("session1", "windows.pslist", {"pid": 4}, cache_key=key) == [1, 2]
+
+
+def test_cache_presence_index(monkeypatch):
+    """Misses are answered without touching entry files; other writers are seen on recheck."""
+    import oroitz.core.cache as cache_module
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir))
+        cache.set("session1", "plugin1", {}, "data1")
+        assert cache.get("session1", "plugin2", {}) is None
+
+        def no_disk(cache_key):
+            raise AssertionError("entry file looked up for a missing key")
+
+        monkeypatch.setattr(cache, "_cache_file", no_disk)
+        assert cache.get("session1", "plugin2", {}) is None
+        monkeypatch.undo()
+
+        assert cache.contains("session1", "plugin1", {})
+        assert not cache.contains("session1", "plugin2", {})
+
+        # An entry written by another cache instance (e.g. another process)
+        Cache(Path(tmpdir)).set("session1", "plugin3", {}, "data3")
+        monkeypatch.setattr(cache_module, "PRESENCE_RECHECK_SECONDS", 0.0)
+        assert cache.get("session1", "plugin3", {}) == "data3"
+
+
+def test_cache_memory_layer_size_budget():
+    """The memory layer keeps frequently used entries within its byte budget."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir))
+        cache.memory_entries = 10
+        cache.memory_bytes = 250
+        hot = ["x" * 100]
+        cache.set("session1", "hot", {}, hot)
+        for _ in range(3):
+            cache.get("session1", "hot", {})
+
+        cache.set("session1", "cold1", {}, ["y" * 100])
+        cache.set("session1", "cold2", {}, ["z" * 100])
+        # Too large to be kept in memory at all
+        cache.set("session1", "huge", {}, ["w" * 1000])
+
+        keys = {cache._get_cache_key("session1", name, {}): name for name in ("hot", "cold2")}
+        assert set(cache._mem) == set(keys)
+        assert cache.get("session1", "huge", {}) == ["w" * 1000]
+
+
+def test_cache_memory_layer_returns_copies():
+    """Changing a returned result does not change what later lookups see."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir))
+        rows = [{"PID": 4, "__children": []}]
+        cache.set("session1", "windows.pslist", {}, rows)
+        rows[0]["PID"] = 8
+
+        first = cache.get("session1", "windows.pslist", {})
+        first[0]["__children"].append({"PID": 12})
+        assert cache.get("session1", "windows.pslist", {}) == [{"PID": 4, "__children": []}]
+
+
+def test_cache_memory_layer_ages_use_counts():
+    """New results are kept in memory even when older entries have been used more."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(Path(tmpdir))
+        cache.memory_entries = 2
+        for name in ("old1", "old2"):
+            cache.set("session1", name, {}, name)
+            cache.get("session1", name, {})
+
+        for name in ("new1", "new2", "new3"):
+            cache.set("session1", name, {}, name)
+            assert cache._get_cache_key("session1", name, {}) in cache._mem
+        assert cache._mem_size == sum(len(entry.payload) for entry in cache._mem.values())
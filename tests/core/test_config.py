@@ -3,6 +3,9 @@
 import os
 from pathlib import Path
 
+import pytest
+from pydantic import ValidationError
+
 from oroitz.core.config import Config
 
 
@@ -14,6 +17,13 @@ def test_config_defaults():
     assert config.max_concurrency == 4
 
 
+def test_config_rejects_unknown_executor_kind():
+    """An unsupported worker pool kind fails when the config is loaded."""
+    assert Config(executor_kind="process").executor_kind == "process"
+    with pytest.raises(ValidationError):
+        Config(executor_kind="fiber")
+
+
 def test_config_env_vars():
     """Test configuration from environment variables."""
     os.environ["OROITZ_LOG_LEVEL"] = "DEBUG"
@@ -24,3 +34,37 @@ def test_config_env_vars():
     # Clean up
     del os.environ["OROITZ_LOG_LEVEL"]
     del os.environ["OROITZ_MAX_CONCURRENCY"]
+
+
+def test_global_config_is_lazy_singleton():
+    """The module-level config is created once and shared by all importers."""
+    import oroitz.core.config as config_module
+    from oroitz.core.config import config
+
+    assert config_module.config is config
+    assert isinstance(config, Config)
+
+
+def test_core_imports_do_not_load_config():
+    """Importing the core modules leaves the global config uncreated."""
+    import subprocess
+    import sys
+
+    code = (
+        "import oroitz.core.session, oroitz.core.executor, oroitz.core.cache, sys; "
+        "sys.exit('config' in vars(sys.modules['oroitz.core.config']))"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_config_from_file(tmp_path):
+    """Test loading an [oroitz] section from TOML, picking up edits."""
+    config_file = tmp_path / "oroitz.toml"
+    config_file.write_text('[oroitz]\nlog_level = "WARNING"\n')
+    assert Config.from_file(config_file).log_level == "WARNING"
+    assert Config.from_file(config_file).config_file == config_file
+
+    config_file.write_text('[oroitz]\nlog_level = "ERROR"\nmax_concurrency = 2\n')
+    config = Config.from_file(config_file)
+    assert config.log_level == "ERROR"
+    assert config.max_concurrency == 2
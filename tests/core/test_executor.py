@@ -83,3 +83,743 @@ def test_execute_workflow():
     assert all(r.success for r in results)
     assert results[0].plugin_name == "windows.pslist"
     assert results[1].plugin_name == "windows.netscan"
+
+
+def test_execute_workflow_process_pool(monkeypatch):
+    """The process pool returns the same ordered results as the thread pool."""
+    from oroitz.core.config import config
+    from oroitz.core.workflow import PluginSpec, WorkflowSpec
+
+    monkeypatch.setattr(config, "executor_kind", "process")
+    executor = Executor()
+
+    workflow = WorkflowSpec(
+        id="test",
+        name="Test",
+        description="Test workflow",
+        plugins=[
+            PluginSpec(name="windows.pslist"),
+            PluginSpec(name="windows.netscan"),
+        ],
+    )
+
+    results = executor.execute_workflow(workflow, "/fake/image")
+
+    assert [r.plugin_name for r in results] == ["windows.pslist", "windows.netscan"]
+    assert [len(r.output) for r in results] == [2, 1]
+
+
+def test_build_vol_command_flags():
+    """True parameters become bare flags, False ones are dropped."""
+    executor = Executor()
+    executor._vol_command = ["vol"]
+
+    cmd = executor._build_vol_command(
+        "windows.pslist", "/fake/image", {"pid": 4, "dump": True, "physical": False}
+    )
+
+    assert cmd[-3:] == ["windows.pslist", "--pid=4", "--dump"]
+
+
+def test_execute_plugin_without_volatility(monkeypatch):
+    """With no backend at all, plugins go straight to mock data without starting a run."""
+    from unittest.mock import patch
+
+    import oroitz.core.executor as executor_module
+
+    monkeypatch.setattr(executor_module, "VOLATILITY_AVAILABLE", False)
+    executor = Executor()
+    executor._volatility_available = False
+
+    with patch.object(executor_module, "log_event") as mock_log:
+        result = executor.execute_plugin("windows.pslist", "/fake/image", force_reexecute=True)
+        sensitive = executor.execute_plugin("windows.hashdump", "/fake/image")
+
+    assert result.used_mock is True
+    assert len(result.output) == 2
+    assert sensitive.success is False
+    assert [c[0][0] for c in mock_log.call_args_list] == ["plugin_mock_fallback", "plugin_failure"]
+
+
+def test_iter_plugin_rows_streams_and_caches(monkeypatch, tmp_path):
+    """Rows are yielded from vol's output, then replayed from the cache."""
+    import json
+    import sys
+
+    from oroitz.core.config import config
+
+    monkeypatch.setattr(config, "volatility_cli_fallback", True)
+    rows = [{"PID": 4, "ImageFileName": "System"}, {"PID": 8, "ImageFileName": "smss.exe"}]
+    executor = Executor()
+    executor._volatility_available = True
+    # Stand-in for vol that ignores its arguments and prints plugin JSON
+    executor._vol_command = [sys.executable, "-c", f"print({json.dumps(json.dumps(rows))})"]
+    image = tmp_path / "image.raw"
+
+    assert list(executor.iter_plugin_rows("windows.pslist", image)) == rows
+
+    executor._vol_command = [sys.executable, "-c", "raise SystemExit(1)"]
+    assert list(executor.iter_plugin_rows("windows.pslist", image)) == rows
+
+
+def test_iter_plugin_rows_uses_python_api(monkeypatch, tmp_path):
+    """With the Python API available, rows come from it and vol is never started."""
+    from unittest.mock import patch
+
+    import oroitz.core.executor as executor_module
+
+    rows = [{"PID": 4, "ImageFileName": "System"}]
+    monkeypatch.setattr(executor_module, "VOLATILITY_AVAILABLE", True)
+    executor = Executor()
+    monkeypatch.setattr(executor, "_run_api_plugin", lambda plugin_name, image_path: rows)
+
+    with patch("oroitz.core.executor.subprocess.Popen") as popen:
+        assert list(executor.iter_plugin_rows("windows.pslist", tmp_path / "image.raw")) == rows
+    popen.assert_not_called()
+
+
+def test_iter_plugin_rows_without_cli_fallback(monkeypatch, tmp_path):
+    """Under the default config an API failure is raised, and vol is never started."""
+    from unittest.mock import patch
+
+    import pytest
+
+    import oroitz.core.executor as executor_module
+
+    def failing_api(plugin_name, image_path):
+        raise RuntimeError("no layers")
+
+    executor = Executor()
+    monkeypatch.setattr(executor, "_run_api_plugin", failing_api)
+    for api_available in (True, False):
+        monkeypatch.setattr(executor_module, "VOLATILITY_AVAILABLE", api_available)
+        with patch("oroitz.core.executor.subprocess.Popen") as popen:
+            with pytest.raises(RuntimeError):
+                list(executor.iter_plugin_rows("windows.pslist", tmp_path / "image.raw"))
+        popen.assert_not_called()
+
+
+def test_resolve_plugin_name_index(monkeypatch):
+    """Plugin names resolve through the case-insensitive and module-path indexes."""
+    import oroitz.core.executor as executor_module
+
+    plugin_list = {"windows.pslist.PsList": object(), "windows.psscan.PsScan": object()}
+    monkeypatch.setattr(executor_module, "_plugin_list", plugin_list)
+    monkeypatch.setattr(
+        executor_module, "_plugin_index", executor_module._index_plugins(plugin_list)
+    )
+    executor_module._resolve_plugin_name.cache_clear()
+    try:
+        resolve = executor_module._resolve_plugin_name
+        assert resolve("windows.pslist.PsList") == "windows.pslist.PsList"
+        assert resolve("WINDOWS.PSSCAN.PSSCAN") == "windows.psscan.PsScan"
+        assert resolve("windows.psscan") == "windows.psscan.PsScan"
+        assert resolve("psscan") == "windows.psscan.PsScan"
+        assert resolve("windows.netscan") is None
+    finally:
+        executor_module._resolve_plugin_name.cache_clear()
+
+
+def test_treegrid_rows_match_json_renderer():
+    """TreeGrid conversion yields the JSON-safe nested rows `vol -r json` prints."""
+    import datetime
+
+    import pytest
+
+    renderers = pytest.importorskip("volatility3.framework.renderers")
+    from oroitz.core.executor import _treegrid_rows
+
+    def generator():
+        yield (0, (4, "System", datetime.datetime(2023, 1, 1), b"\x01\x02"))
+        yield (1, (8, "smss.exe", renderers.UnreadableValue(), b""))
+        yield (0, (9, "csrss.exe", renderers.NotAvailableValue(), b"\xff"))
+
+    grid = renderers.TreeGrid(
+        [("PID", int), ("Name", str), ("CreateTime", datetime.datetime), ("Data", bytes)],
+        generator(),
+    )
+
+    rows = _treegrid_rows(grid)
+
+    assert [row["PID"] for row in rows] == [4, 9]
+    assert rows[0]["CreateTime"] == "2023-01-01T00:00:00"
+    assert rows[0]["Data"] == "01 02"
+    assert rows[0]["__children"] == [
+        {"__children": [], "PID": 8, "Name": "smss.exe", "CreateTime": None, "Data": ""}
+    ]
+    assert rows[1]["CreateTime"] is None
+    # An already populated grid is converted by visiting it
+    assert _treegrid_rows(grid) == rows
+
+
+def test_image_context_reuses_stacked_config(tmp_path):
+    """Layers stacked for one plugin are rebuilt from configuration in a later plugin's context."""
+    import os
+
+    import pytest
+
+    pytest.importorskip("volatility3")
+    from volatility3.framework.automagic.construct_layers import ConstructionMagic
+    from volatility3.framework.configuration import requirements
+    from volatility3.framework.layers import physical
+
+    image = tmp_path / "image.raw"
+    image.write_bytes(b"\0" * 16)
+    executor = Executor()
+    image_ctx = executor._image_context(str(image))
+    assert executor._image_context(str(image)) is image_ctx
+
+    layer = requirements.TranslationLayerRequirement(name="primary")
+    intel_layer = requirements.TranslationLayerRequirement(
+        name="primary", architectures=["Intel32", "Intel64"]
+    )
+
+    def plugin(requirement):
+        return type("Plugin", (), {"get_requirements": staticmethod(lambda: [requirement])})
+
+    # What automagic stacks for the first plugin
+    first = image_ctx.new_context()
+    first.config["plugins.First.primary.class"] = "volatility3.framework.layers.physical.FileLayer"
+    first.config["plugins.First.primary.location"] = image.as_uri()
+    first.add_layer(physical.FileLayer(first, "plugins.First.primary", "memory_layer"))
+    first.config["plugins.First.primary"] = "memory_layer"
+    image_ctx.remember_stacked(first, "windows", plugin(layer), "plugins.First")
+
+    # Reused by a later plugin with the same requirement, in a context of its own
+    second = image_ctx.new_context()
+    image_ctx.reuse_stacked(second, "windows", plugin(layer), "plugins.Second")
+    ConstructionMagic(second, "automagic.ConstructionMagic")(second, "plugins.Second", layer)
+    assert layer.unsatisfied(second, "plugins.Second") == {}
+
+    # Not reused for another OS or for a requirement with other constraints
+    third = image_ctx.new_context()
+    image_ctx.reuse_stacked(third, "linux", plugin(layer), "plugins.Third")
+    image_ctx.reuse_stacked(third, "windows", plugin(intel_layer), "plugins.Fourth")
+    assert "plugins.Third.primary.class" not in third.config
+    assert "plugins.Fourth.primary.class" not in third.config
+
+    # A modified image gets fresh configuration, even if its mtime is restored
+    stat = image.stat()
+    image.write_bytes(b"\0" * 32)
+    os.utime(image, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert executor._image_context(str(image)) is not image_ctx
+
+
+def test_detect_os_probe_priority(monkeypatch):
+    """The earliest matching OS in order wins, whichever probe finishes first."""
+    # Probes run in parallel, off the plugin pool; undecided ones are cancelled
+    import threading
+
+    import pytest
+
+    import oroitz.core.executor as executor_module
+
+    if not executor_module.VOLATILITY_AVAILABLE:
+        pytest.skip("volatility3 not installed")
+
+    def run(matches):
+        started = threading.Barrier(3, timeout=5)
+        linux_done = threading.Event()
+        cancelled_probes = []
+
+        def fake_probe(image_path, plugin_name, cancelled):
+            started.wait()
+            if plugin_name == "linux.info":
+                linux_done.set()
+            elif plugin_name == "windows.info":
+                # Windows answers only after linux has already matched
+                linux_done.wait(5)
+            elif cancelled.wait(5):
+                cancelled_probes.append(plugin_name)
+            if plugin_name not in matches:
+                raise RuntimeError("not this OS")
+
+        executor = Executor()
+        monkeypatch.setattr(executor, "_probe_os", fake_probe)
+        detected = executor._run_os_probes("/fake/image")
+        assert executor._thread_pool is None
+        for _ in range(50):
+            if cancelled_probes:
+                break
+            threading.Event().wait(0.1)
+        return detected, cancelled_probes
+
+    assert run({"windows.info", "linux.info"}) == ("windows", ["mac.info"])
+    assert run({"linux.info"}) == ("linux", ["mac.info"])
+
+
+def test_detect_os_cached_by_fingerprint(monkeypatch, tmp_path):
+    """A detected OS is reused for the same image and re-probed once the image changes."""
+    import os
+
+    import pytest
+
+    import oroitz.core.executor as executor_module
+    from oroitz.core.cache import Cache
+
+    if not executor_module.VOLATILITY_AVAILABLE:
+        pytest.skip("volatility3 not installed")
+
+    cache = Cache(tmp_path / "cache")
+    monkeypatch.setattr(executor_module, "get_cache", lambda: cache)
+    image = tmp_path / "image.raw"
+    image.write_bytes(b"\0" * 16)
+    probes = []
+    executor = Executor()
+    monkeypatch.setattr(executor, "_run_os_probes", lambda path: probes.append(path) or "windows")
+
+    assert executor._detect_os(str(image)) == "windows"
+    cache._mem.clear()
+    assert executor._detect_os(str(image)) == "windows"
+    assert len(probes) == 1
+
+    os.utime(image, ns=(0, 0))
+    assert executor._detect_os(str(image)) == "windows"
+    assert len(probes) == 2
+
+
+def test_execute_workflow_filters_other_os_plugins(monkeypatch):
+    """Plugins for another OS are skipped; OS-independent plugins still run."""
+    from oroitz.core.workflow import PluginSpec, WorkflowSpec
+
+    executor = Executor()
+    monkeypatch.setattr(executor, "_detect_os", lambda image_path: "linux")
+
+    workflow = WorkflowSpec(
+        id="test",
+        name="Test",
+        description="Test workflow",
+        plugins=[
+            PluginSpec(name="windows.pslist"),
+            PluginSpec(name="linux.pslist"),
+            PluginSpec(name="timeliner"),
+            PluginSpec(name="mac.pslist"),
+        ],
+    )
+
+    results = executor.execute_workflow(workflow, "/fake/image")
+
+    assert [r.plugin_name for r in results] == ["linux.pslist", "timeliner"]
+
+
+def test_execute_workflow_reuses_pool_and_limits_concurrency(monkeypatch):
+    """Workflows share one pool; large images run fewer plugins at a time."""
+    import threading
+    import time
+
+    from oroitz.core.executor import ExecutionResult
+    from oroitz.core.workflow import PluginSpec, WorkflowSpec
+
+    executor = Executor()
+    executor.max_concurrency = 4
+    monkeypatch.setattr(executor, "_detect_os", lambda image_path: None)
+    monkeypatch.setattr(executor, "_get_image_size_gb", lambda image_path: 3.0)
+
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_execute(plugin_name, image_path, session_id=None, force_reexecute=False, **kw):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return ExecutionResult(plugin_name=plugin_name, success=True, duration=0, timestamp=0)
+
+    monkeypatch.setattr(executor, "execute_plugin", fake_execute)
+    workflow = WorkflowSpec(
+        id="test",
+        name="Test",
+        description="Test workflow",
+        plugins=[PluginSpec(name=f"windows.plugin{i}") for i in range(6)],
+    )
+
+    results = executor.execute_workflow(workflow, "/fake/image")
+    pool = executor._get_pool()
+    executor.execute_workflow(workflow, "/fake/image")
+
+    assert [r.plugin_name for r in results] == [f"windows.plugin{i}" for i in range(6)]
+    assert executor._get_pool() is pool
+    assert peak == 2
+    executor.shutdown()
+
+
+def test_image_size_measured_once_per_workflow(monkeypatch, tmp_path):
+    """Plugin timeouts reuse the image size the workflow measured."""
+    import os
+
+    from oroitz.core.executor import ExecutionResult
+    from oroitz.core.workflow import PluginSpec, WorkflowSpec
+
+    image = tmp_path / "image.raw"
+    image.write_bytes(b"\0" * 1024)
+    executor = Executor()
+    monkeypatch.setattr(executor, "_detect_os", lambda image_path: None)
+    sizes = []
+
+    def fake_execute(plugin_name, image_path, session_id=None, force_reexecute=False, **kw):
+        # The CLI path sizes its timeout from the image
+        sizes.append(executor._get_image_size_gb(image_path))
+        return ExecutionResult(plugin_name=plugin_name, success=True, duration=0, timestamp=0)
+
+    monkeypatch.setattr(executor, "execute_plugin", fake_execute)
+    stats = []
+    real_stat = os.stat
+
+    def counting_stat(path, *args, **kwargs):
+        if os.fspath(path) == str(image):
+            stats.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", counting_stat)
+    workflow = WorkflowSpec(
+        id="test",
+        name="Test",
+        description="Test workflow",
+        plugins=[PluginSpec(name="windows.pslist"), PluginSpec(name="windows.netscan")],
+    )
+    executor.execute_workflow(workflow, image)
+    executor.execute_workflow(workflow, image)
+
+    assert sizes == [1024 / (1024**3)] * 4
+    # One stat per workflow run, none per plugin
+    assert len(stats) == 2
+
+
+def test_execute_workflow_api_path_stats_image_once(monkeypatch, tmp_path):
+    """OS detection, image contexts and cache keys of API-path plugins share one stat."""
+    import os
+
+    import pytest
+
+    import oroitz.core.executor as executor_module
+    from oroitz.core.cache import Cache
+    from oroitz.core.workflow import PluginSpec, WorkflowSpec
+
+    if not executor_module.VOLATILITY_AVAILABLE:
+        pytest.skip("volatility3 not installed")
+
+    image = tmp_path / "image.raw"
+    image.write_bytes(b"\0" * 1024)
+    cache = Cache(tmp_path / "cache")
+    monkeypatch.setattr(executor_module, "get_cache", lambda: cache)
+
+    class FakePlugin:
+        def run(self):
+            return []
+
+    monkeypatch.setattr(executor_module.plugins, "construct_plugin", lambda *args: FakePlugin())
+    monkeypatch.setattr(executor_module, "_treegrid_rows", lambda treegrid: treegrid)
+    executor = Executor()
+    monkeypatch.setattr(executor, "_run_os_probes", lambda image_path: "windows")
+    stats = []
+    real_stat = os.stat
+
+    def counting_stat(path, *args, **kwargs):
+        if os.fspath(path) == str(image):
+            stats.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", counting_stat)
+    workflow = WorkflowSpec(
+        id="test",
+        name="Test",
+        description="Test workflow",
+        plugins=[PluginSpec(name="windows.pslist"), PluginSpec(name="windows.pstree")],
+    )
+    results = executor.execute_workflow(workflow, image)
+
+    assert [r.used_mock for r in results] == [False, False]
+    assert len(stats) == 1
+
+
+def test_execute_workflow_runs_duplicate_specs_once(monkeypatch):
+    """A plugin listed twice with the same parameters runs once; each spec gets a result."""
+    from oroitz.core.executor import ExecutionResult
+    from oroitz.core.workflow import PluginSpec, WorkflowSpec
+
+    executor = Executor()
+    monkeypatch.setattr(executor, "_detect_os", lambda image_path: None)
+    calls = []
+
+    def fake_execute(plugin_name, image_path, session_id=None, force_reexecute=False, **kw):
+        calls.append((plugin_name, kw))
+        return ExecutionResult(plugin_name=plugin_name, success=True, duration=0, timestamp=0)
+
+    monkeypatch.setattr(executor, "execute_plugin", fake_execute)
+    workflow = WorkflowSpec(
+        id="test",
+        name="Test",
+        description="Test workflow",
+        plugins=[
+            PluginSpec(name="windows.pslist"),
+            PluginSpec(name="windows.handles", parameters={"pid": 4}),
+            PluginSpec(name="windows.pslist"),
+            PluginSpec(name="windows.handles", parameters={"pid": 8}),
+        ],
+    )
+
+    results = executor.execute_workflow(workflow, "/fake/image")
+
+    assert [r.plugin_name for r in results] == [
+        "windows.pslist",
+        "windows.handles",
+        "windows.pslist",
+        "windows.handles",
+    ]
+    assert results[2] is not results[0]
+    assert sorted(calls, key=repr) == [
+        ("windows.handles", {"pid": 4}),
+        ("windows.handles", {"pid": 8}),
+        ("windows.pslist", {}),
+    ]
+
+
+def test_execute_workflow_reads_cached_plugins_inline(monkeypatch, tmp_path):
+    """Plugins with cached results run on the calling thread; the rest go to the pool."""
+    import threading
+
+    import oroitz.core.executor as executor_module
+    from oroitz.core.cache import Cache
+    from oroitz.core.executor import ExecutionResult
+    from oroitz.core.workflow import PluginSpec, WorkflowSpec
+
+    cache = Cache(tmp_path / "cache")
+    monkeypatch.setattr(executor_module, "get_cache", lambda: cache)
+    executor = Executor()
+    params = executor._cache_params("/fake/image", {})
+    cache.set("default", "windows.pslist", params, [{"PID": 4}])
+    monkeypatch.setattr(executor, "_detect_os", lambda image_path: None)
+    threads = {}
+
+    def fake_execute(plugin_name, image_path, session_id=None, force_reexecute=False, **kw):
+        threads[plugin_name] = threading.current_thread()
+        return ExecutionResult(plugin_name=plugin_name, success=True, duration=0, timestamp=0)
+
+    monkeypatch.setattr(executor, "execute_plugin", fake_execute)
+    workflow = WorkflowSpec(
+        id="test",
+        name="Test",
+        description="Test workflow",
+        plugins=[PluginSpec(name="windows.netscan"), PluginSpec(name="windows.pslist")],
+    )
+
+    results = executor.execute_workflow(workflow, "/fake/image")
+
+    assert [r.plugin_name for r in results] == ["windows.netscan", "windows.pslist"]
+    assert threads["windows.pslist"] is threading.current_thread()
+    assert threads["windows.netscan"] is not threading.current_thread()
+
+
+def test_process_worker_reuses_its_executor(monkeypatch):
+    """Pool workers keep one Executor, and with it their image contexts, across tasks."""
+    import oroitz.core.executor as executor_module
+
+    monkeypatch.setattr(executor_module, "_worker_executor", None)
+    executor_module._execute_plugin_worker("windows.pslist", "/fake/image", None, False, {})
+    worker_executor = executor_module._worker_executor
+    executor_module._execute_plugin_worker("windows.netscan", "/fake/image", None, False, {})
+
+    assert worker_executor is not None
+    assert executor_module._worker_executor is worker_executor
+
+
+def test_cache_key_follows_image_contents(monkeypatch, tmp_path):
+    """Replacing the image at the same path invalidates its cached plugin results."""
+    import os
+
+    import oroitz.core.executor as executor_module
+    from oroitz.core.cache import Cache
+
+    cache = Cache(tmp_path / "cache")
+    monkeypatch.setattr(executor_module, "get_cache", lambda: cache)
+    image = tmp_path / "image.raw"
+    image.write_bytes(b"\0" * 16)
+    executor = Executor()
+    monkeypatch.setattr(executor, "_execute_volatility_plugin", lambda *a, **kw: ([{"PID": 4}], 1))
+
+    assert executor.execute_plugin("windows.pslist", str(image)).attempts == 1
+    assert executor.execute_plugin("windows.pslist", str(image)).attempts == 0
+
+    image.write_bytes(b"\0" * 32)
+    os.utime(image, ns=(0, 0))
+    assert executor.execute_plugin("windows.pslist", str(image)).attempts == 1
+
+
+def test_cli_probe_deferred_to_first_use(monkeypatch):
+    """Creating an Executor never starts a probe process; the first CLI use does."""
+    from types import SimpleNamespace
+
+    import oroitz.core.executor as executor_module
+
+    monkeypatch.setattr(executor_module, "VOLATILITY_AVAILABLE", False)
+    monkeypatch.setattr(
+        executor_module.shutil,
+        "which",
+        lambda name: "/usr/bin/poetry" if name == "poetry" else None,
+    )
+    runs = []
+
+    def fake_run(cmd, **kwargs):
+        runs.append(cmd)
+        return SimpleNamespace(returncode=1, stdout="")
+
+    monkeypatch.setattr(executor_module.subprocess, "run", fake_run)
+    executor_module._probe_vol_command.cache_clear()
+    try:
+        executor = Executor()
+        assert runs == []
+        assert executor._ensure_cli() is False
+        assert executor._ensure_cli() is False
+        assert runs == [["poetry", "run", "vol"]]
+    finally:
+        executor_module._probe_vol_command.cache_clear()
+
+
+def test_no_cli_probe_without_api_by_default(monkeypatch):
+    """Without the API, and with the CLI fallback off, plugins go straight to mock data."""
+    import oroitz.core.executor as executor_module
+
+    monkeypatch.setattr(executor_module, "VOLATILITY_AVAILABLE", False)
+    executor = Executor()
+    executor._volatility_available = None
+
+    def probe():
+        raise AssertionError("vol CLI probed")
+
+    monkeypatch.setattr(executor, "_ensure_cli", probe)
+    result = executor.execute_plugin("windows.pslist", "/fake/image", force_reexecute=True)
+    assert result.used_mock is True
+
+
+def test_frozen_build_uses_vol_script(monkeypatch):
+    """A frozen executable cannot run -c, so the vol script on PATH is used instead."""
+    import oroitz.core.executor as executor_module
+
+    monkeypatch.setattr(executor_module, "VOLATILITY_AVAILABLE", True)
+    monkeypatch.setattr(executor_module.shutil, "which", lambda name: f"/usr/bin/{name}")
+    assert executor_module._find_vol_command()[1:] == ("-c", executor_module._VOL_MAIN)
+
+    monkeypatch.setattr(executor_module.sys, "frozen", True, raising=False)
+    assert executor_module._find_vol_command() == ("/usr/bin/vol",)
+
+
+def test_executor_releases_image_contexts(tmp_path):
+    """Loading another image drops idle contexts; shutdown releases pools and contexts."""
+    import pytest
+
+    pytest.importorskip("volatility3")
+
+    images = []
+    for name in ("first.raw", "second.raw"):
+        image = tmp_path / name
+        image.write_bytes(b"\0" * 16)
+        images.append(str(image))
+
+    with Executor() as executor:
+        executor._image_context(images[0])
+        # The first image is still in use by a running workflow
+        executor._image_stats[images[0]] = None
+        executor._image_context(images[1])
+        assert set(executor._contexts) == set(images)
+
+        executor._image_stats.clear()
+        executor._image_context(images[0])
+        assert set(executor._contexts) == {images[0]}
+        executor._get_pool()
+
+    assert executor._contexts == {}
+    assert executor._thread_pool is None
+
+
+def test_api_plugins_run_outside_the_image_lock(monkeypatch, tmp_path):
+    """Plugins on one image are constructed one at a time but run concurrently."""
+    import concurrent.futures
+    import threading
+
+    import pytest
+
+    import oroitz.core.executor as executor_module
+
+    if not executor_module.VOLATILITY_AVAILABLE:
+        pytest.skip("volatility3 not installed")
+
+    image = tmp_path / "image.raw"
+    image.write_bytes(b"\0" * 16)
+    running = threading.Barrier(2, timeout=5)
+    contexts = []
+
+    class FakePlugin:
+        def run(self):
+            running.wait()
+            return []
+
+    def construct_plugin(ctx, automagics, plugin_class, *args):
+        contexts.append(ctx)
+        return FakePlugin()
+
+    monkeypatch.setattr(executor_module.plugins, "construct_plugin", construct_plugin)
+    monkeypatch.setattr(executor_module, "_treegrid_rows", lambda treegrid: treegrid)
+    executor = Executor()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(executor._execute_volatility_plugin, name, str(image))
+            for name in ("windows.pslist", "windows.pstree")
+        ]
+        assert [future.result() for future in futures] == [([], 1), ([], 1)]
+    assert contexts[0] is not contexts[1]
+
+
+def test_executor_refuses_work_after_shutdown():
+    """A shut down executor raises instead of running plugins that could no longer retry."""
+    import pytest
+
+    from oroitz.core.workflow import PluginSpec, WorkflowSpec
+
+    executor = Executor()
+    executor.shutdown()
+    workflow = WorkflowSpec(
+        id="test",
+        name="Test",
+        description="Test workflow",
+        plugins=[PluginSpec(name="windows.pslist")],
+    )
+
+    with pytest.raises(RuntimeError, match="executor is shut down"):
+        executor.execute_plugin("windows.pslist", "/fake/image")
+    with pytest.raises(RuntimeError, match="executor is shut down"):
+        executor.execute_workflow(workflow, "/fake/image")
+    with pytest.raises(RuntimeError, match="executor is shut down"):
+        next(executor.iter_plugin_rows("windows.pslist", "/fake/image"))
+    with pytest.raises(RuntimeError, match="executor is shut down"):
+        executor._get_pool()
+    assert executor._thread_pool is None
+
+
+def test_automagics_chosen_once_per_plugin_class():
+    """Each context gets its own instances of the automagics available() would choose."""
+    import pytest
+
+    import oroitz.core.executor as executor_module
+
+    if not executor_module.VOLATILITY_AVAILABLE:
+        pytest.skip("volatility3 not installed")
+
+    from volatility3.framework import automagic, contexts
+
+    plugin_class = executor_module._get_plugin_list()["windows.pslist.PsList"]
+    first, second = contexts.Context(), contexts.Context()
+    expected = automagic.choose_automagic(automagic.available(first), plugin_class)
+
+    chosen = executor_module._choose_automagics(first, plugin_class)
+    again = executor_module._choose_automagics(second, plugin_class)
+
+    assert [type(a) for a in chosen] == [type(a) for a in expected]
+    assert [a.config_path for a in chosen] == [a.config_path for a in expected]
+    assert all(a.context is first for a in chosen)
+    assert all(a.context is second for a in again)
+    assert executor_module._automagic_classes.cache_info().hits >= 1
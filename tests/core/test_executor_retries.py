@@ -1,22 +1,49 @@
 """Tests for executor retry and fallback behavior."""
 
+import io
 import json
+import subprocess
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+import oroitz.core.executor as executor_module
 from oroitz.core.config import config
 from oroitz.core.executor import Executor
 
 
-def _make_result(returncode: int, stdout: str = "", stderr: str = ""):
-    mock = MagicMock()
-    mock.returncode = returncode
-    mock.stdout = stdout
-    mock.stderr = stderr
-    return mock
+@pytest.fixture(autouse=True)
+def cli_fallback(monkeypatch):
+    """These tests drive the vol CLI, which is only used when opted in."""
+    monkeypatch.setattr(config, "volatility_cli_fallback", True)
+
+
+def _fake_popen(*runs):
+    """Popen stand-in replaying (returncode, stdout) runs, piped or spooled to a file."""
+    pending = list(runs)
+
+    def popen(cmd, stdout=None, **kwargs):
+        returncode, output = pending.pop(0)
+        mock = MagicMock()
+        mock.__enter__.return_value = mock
+        mock.returncode = returncode
+        mock.wait.return_value = returncode
+        if stdout is subprocess.PIPE:
+            mock.stdout = io.BufferedReader(io.BytesIO(output.encode()))
+        else:
+            stdout.write(output.encode())
+            stdout.flush()
+        return mock
+
+    return popen
 
 
-def test_retry_then_success(monkeypatch):
+@pytest.mark.parametrize("streaming", [True, False])
+def test_retry_then_success(monkeypatch, streaming):
     """Simulate a transient failure followed by success; ensure attempts count increments."""
+    if streaming and not executor_module.IJSON_AVAILABLE:
+        pytest.skip("ijson not installed")
+    monkeypatch.setattr(executor_module, "IJSON_AVAILABLE", streaming)
     # Reduce backoff to 0 for test speed and set attempts to 3
     config.volatility_retry_attempts = 3
     config.volatility_retry_backoff_seconds = 0
@@ -32,19 +59,20 @@ def test_retry_then_success(monkeypatch):
     executor._vol_command = ["vol"]
 
     # First attempt fails, second succeeds
-    fail = _make_result(1, stdout="", stderr="transient")
     success_stdout = json.dumps([{"PID": 42, "ImageFileName": "proc.exe"}])
-    success = _make_result(0, stdout=success_stdout, stderr="")
 
     # Force Python API to fail so we test CLI retry logic
     with (
         patch("oroitz.core.executor.contexts.Context", side_effect=Exception("Python API failed")),
-        patch("oroitz.core.executor.subprocess.run", side_effect=[fail, success]),
+        patch(
+            "oroitz.core.executor.subprocess.Popen",
+            side_effect=_fake_popen((1, ""), (0, success_stdout)),
+        ),
     ):
         result = executor.execute_plugin("windows.pslist", "/fake/image")
 
     assert result.success
-    assert result.output is not None
+    assert result.output == [{"PID": 42, "ImageFileName": "proc.exe"}]
     assert result.attempts == 2
 
 
@@ -63,12 +91,10 @@ def test_permanent_failure_fallback(monkeypatch):
     executor._volatility_available = True
     executor._vol_command = ["vol"]
 
-    fail = _make_result(1, stdout="", stderr="error")
-
     # All attempts fail, should fallback to mock data
     with (
         patch("oroitz.core.executor.contexts.Context", side_effect=Exception("Python API failed")),
-        patch("oroitz.core.executor.subprocess.run", side_effect=[fail, fail, fail]),
+        patch("oroitz.core.executor.subprocess.Popen", side_effect=_fake_popen(*[(1, "")] * 3)),
     ):
         result = executor.execute_plugin("windows.pslist", "/fake/image")
 
@@ -79,3 +105,112 @@ def test_permanent_failure_fallback(monkeypatch):
     assert result.error is None
     assert result.used_mock is True
     assert result.attempts == 0  # Mock doesn't count attempts
+
+
+def test_json_error_is_retried():
+    """Invalid JSON on a zero exit code counts as a failed attempt."""
+    config.volatility_retry_attempts = 2
+    config.volatility_retry_backoff_seconds = 0
+
+    from oroitz.core.cache import cache
+
+    cache.clear()
+
+    executor = Executor()
+    executor._volatility_available = True
+    executor._vol_command = ["vol"]
+
+    garbled = '[{"PID": 42, '
+    success = json.dumps({"rows": [{"PID": 7}]})
+
+    with (
+        patch("oroitz.core.executor.contexts.Context", side_effect=Exception("Python API failed")),
+        patch(
+            "oroitz.core.executor.subprocess.Popen",
+            side_effect=_fake_popen((0, garbled), (0, success)),
+        ),
+    ):
+        result = executor.execute_plugin("windows.pslist", "/fake/image")
+
+    assert result.output == [{"PID": 7}]
+    assert result.attempts == 2
+    # The key holding the rows is remembered for the next run of the plugin
+    assert executor._data_keys == {"windows.pslist": "rows"}
+
+
+def test_backoff_budget_stops_retries(monkeypatch):
+    """Retries stop once the total backoff budget is spent."""
+    monkeypatch.setattr(config, "volatility_retry_attempts", 5)
+    monkeypatch.setattr(config, "volatility_retry_backoff_seconds", 0.05)
+    monkeypatch.setattr(config, "volatility_retry_total_seconds", 0.1)
+
+    from oroitz.core.cache import cache
+
+    cache.clear()
+
+    executor = Executor()
+    executor._volatility_available = True
+    executor._vol_command = ["vol"]
+
+    with (
+        patch("oroitz.core.executor.contexts.Context", side_effect=Exception("Python API failed")),
+        patch(
+            "oroitz.core.executor.subprocess.Popen", side_effect=_fake_popen(*[(1, "")] * 5)
+        ) as popen,
+    ):
+        result = executor.execute_plugin("windows.pslist", "/fake/image")
+
+    # 0.05s + 0.05s (second wait capped from 0.1s) exhausts the budget after three runs
+    assert popen.call_count == 3
+    assert result.used_mock is True
+
+
+def test_shutdown_interrupts_backoff(monkeypatch):
+    """A shut down executor does not wait out its backoff."""
+    monkeypatch.setattr(config, "volatility_retry_attempts", 3)
+    monkeypatch.setattr(config, "volatility_retry_backoff_seconds", 60)
+
+    from oroitz.core.cache import cache
+
+    cache.clear()
+
+    executor = Executor()
+    executor._volatility_available = True
+    executor._vol_command = ["vol"]
+    fake_popen = _fake_popen(*[(1, "")] * 5)
+
+    def popen_then_shutdown(*args, **kwargs):
+        # Shut down while the first attempt is running, before its backoff starts
+        executor.shutdown()
+        return fake_popen(*args, **kwargs)
+
+    with (
+        patch("oroitz.core.executor.contexts.Context", side_effect=Exception("Python API failed")),
+        patch("oroitz.core.executor.subprocess.Popen", side_effect=popen_then_shutdown) as popen,
+    ):
+        result = executor.execute_plugin("windows.pslist", "/fake/image")
+
+    assert popen.call_count == 1
+    assert result.used_mock is True
+
+
+def test_python_api_failure_without_cli_fallback(monkeypatch):
+    """With the CLI fallback disabled, an API failure never spawns vol."""
+    monkeypatch.setattr(config, "volatility_cli_fallback", False)
+
+    from oroitz.core.cache import cache
+
+    cache.clear()
+
+    executor = Executor()
+    executor._volatility_available = True
+    executor._vol_command = ["vol"]
+
+    with (
+        patch("oroitz.core.executor.contexts.Context", side_effect=Exception("Python API failed")),
+        patch("oroitz.core.executor.subprocess.Popen") as popen,
+    ):
+        result = executor.execute_plugin("windows.pslist", "/fake/image")
+
+    popen.assert_not_called()
+    assert result.used_mock is True
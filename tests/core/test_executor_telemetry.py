@@ -1,13 +1,17 @@
 """Telemetry tests for executor retry/fallback events."""
 
-from unittest.mock import patch
+import io
+from unittest.mock import MagicMock, patch
 
 from oroitz.core.config import config
 from oroitz.core.executor import Executor
 
 
-def test_retry_and_fallback_telemetry():
+def test_retry_and_fallback_telemetry(caplog, monkeypatch):
     """Test telemetry events during retry and mock data fallback."""
+    monkeypatch.setattr(config, "volatility_cli_fallback", True)
+    # Events are only built when INFO is enabled
+    caplog.set_level("INFO", logger="oroitz")
     # Configure retries
     config.volatility_retry_attempts = 2
     config.volatility_retry_backoff_seconds = 0
@@ -21,14 +25,35 @@ def test_retry_and_fallback_telemetry():
     cache.clear()
 
     # Simulate two failing runs to hit failure
-    fail = type("R", (), {"returncode": 1, "stdout": "", "stderr": "err"})
-
-    with patch("oroitz.core.executor.subprocess.run", side_effect=[fail, fail]):
+    def fail():
+        proc = MagicMock()
+        proc.__enter__.return_value = proc
+        proc.wait.return_value = 1
+        proc.stdout = io.BufferedReader(io.BytesIO(b""))
+        return proc
+
+    with patch("oroitz.core.executor.subprocess.Popen", side_effect=[fail(), fail()]):
         # Patch the log_event as imported into the executor module
         with patch("oroitz.core.executor.log_event") as mock_log:
             executor.execute_plugin("windows.pslist", "/fake/image", "windows")
 
             # Should have emitted retry and fallback events
             calls = [c[0][0] for c in mock_log.call_args_list]
+            assert "vol_exec" in calls
             assert "plugin_retry" in calls
             assert "plugin_mock_fallback" in calls
+
+
+def test_log_event_skipped_below_info():
+    """Events are not serialized at all when INFO is filtered out."""
+    from oroitz.core import telemetry
+
+    level = telemetry.logger.level
+    telemetry.logger.setLevel("WARNING")
+    try:
+        with patch.object(telemetry.json, "dumps") as mock_dumps:
+            telemetry.log_event("vol_exec", {"argv": ["vol"]})
+        mock_dumps.assert_not_called()
+        assert not telemetry.events_enabled()
+    finally:
+        telemetry.logger.setLevel(level)